@@ -1,10 +1,37 @@
 import logging
-from flask import Flask, jsonify, request, abort, send_from_directory
+import click
+from flask import Flask, Response, g, has_request_context, jsonify, request, abort, stream_with_context
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
+import base64
+from collections import Counter
+import bisect
+import functools
+import hashlib
+import json
 import os
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlencode
 
-app = Flask(__name__, static_folder='../EasyToGet/build/static', static_url_path='/static')
+# Make sibling modules importable both via `python app.py` and gunicorn's backend-python.app
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from compression import gzip_stream
+from dedupe import canonicalize_url, delete_duplicates_statement, duplicate_rows_statement
+from linkcheck import LinkChecker
+from log_pipeline import configure_logging, parse_sample_rates
+from metrics import QUERY_COUNT_BUCKETS, MetricsRegistry
+from response_cache import CachedResponse, ResponseCache, make_etag, make_key
+from search_index import PrefixIndex, SearchIndex
+from serialization import dumps, rows_to_dicts
+from static_assets import StaticAssetCache, gzip_bytes, is_compressible
+from storage import WriteSerializer, absolute_sqlite_uri, apply_sqlite_pragmas, is_sqlite_file, sqlite_engine_options
+
+# The React build, including /static, is served from the in-memory StaticAssetCache below
+app = Flask(__name__, static_folder=None)
 # Allow CORS from any origin for development purposes
 CORS(app, resources={r"/*": {"origins": "https://easytoget.netlify.app"}})
 
@@ -12,18 +39,65 @@ CORS(app, resources={r"/*": {"origins": "https://easytoget.netlify.app"}})
 react_build_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../EasyToGet/build'))
 
 # Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+# Log records are queued and written as batched JSON lines by a background thread
+configure_logging(
+    level=logging.INFO,
+    batch_size=int(os.environ.get('LOG_BATCH_SIZE', 100)),
+    flush_interval=float(os.environ.get('LOG_FLUSH_INTERVAL', 0.5))
+)
 logger = logging.getLogger(__name__)
 
 # Configure SQLite database with environment variable support
 basedir = os.path.abspath(os.path.dirname(__file__))
-db_path = os.environ.get('DATABASE_URL', 'sqlite:///' + os.path.join(basedir, 'easytoget.db'))
+# A relative sqlite:/// path is taken relative to backend-python/, whichever entry point imports the app
+db_path = absolute_sqlite_uri(os.environ.get('DATABASE_URL', 'sqlite:///' + os.path.join(basedir, 'easytoget.db')), basedir)
 app.config['SQLALCHEMY_DATABASE_URI'] = db_path
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['RESPONSE_CACHE_MAX_ENTRIES'] = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 256))
+app.config['RESPONSE_CACHE_TTL'] = int(os.environ.get('RESPONSE_CACHE_TTL', 300))
+# Total bytes of cached bodies (plain + gzip) per worker, and the largest body worth caching
+app.config['RESPONSE_CACHE_MAX_BYTES'] = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+app.config['RESPONSE_CACHE_MAX_ENTRY_BYTES'] = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRY_BYTES', 4 * 1024 * 1024))
+# Log requests slower than this many milliseconds; 0 disables the slow-request log
+app.config['SLOW_REQUEST_MS'] = float(os.environ.get('SLOW_REQUEST_MS', 0))
+# Request log sampling: default rate, per-route overrides ("/search=0.1,/content=0.5") and endpoints never logged
+app.config['LOG_SAMPLE_RATE'] = float(os.environ.get('LOG_SAMPLE_RATE', 1.0))
+app.config['LOG_SAMPLE_RATES'] = parse_sample_rates(os.environ.get('LOG_SAMPLE_RATES', ''))
+app.config['LOG_EXCLUDE_ENDPOINTS'] = set(os.environ.get('LOG_EXCLUDE_ENDPOINTS', 'serve_react_app,serve_react_files,metrics_endpoint').split(','))
+# Production profile for file-backed SQLite shared by several gunicorn workers
+app.config['SQLITE_BUSY_TIMEOUT_MS'] = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+app.config['SQLITE_MMAP_SIZE'] = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+app.config['SQLITE_CACHE_SIZE_KB'] = int(os.environ.get('SQLITE_CACHE_SIZE_KB', 64 * 1024))
+app.config['SQLITE_POOL_SIZE'] = int(os.environ.get('SQLITE_POOL_SIZE', 5))
+# Dynamic responses smaller than COMPRESS_MIN_SIZE bytes are sent uncompressed
+app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+app.config['COMPRESS_LEVEL'] = int(os.environ.get('COMPRESS_LEVEL', 6))
+# Link checker: total concurrent requests, concurrent requests per host, per-request timeout and retries
+app.config['LINK_CHECK_WORKERS'] = int(os.environ.get('LINK_CHECK_WORKERS', 32))
+app.config['LINK_CHECK_PER_HOST'] = int(os.environ.get('LINK_CHECK_PER_HOST', 4))
+app.config['LINK_CHECK_TIMEOUT'] = float(os.environ.get('LINK_CHECK_TIMEOUT', 10))
+app.config['LINK_CHECK_RETRIES'] = int(os.environ.get('LINK_CHECK_RETRIES', 2))
+sqlite_file = is_sqlite_file(db_path)
+if sqlite_file:
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = sqlite_engine_options(app.config)
 
 db = SQLAlchemy(app)
 
+with app.app_context():
+    if sqlite_file:
+        apply_sqlite_pragmas(db.engine, app.config)
+    write_serializer = WriteSerializer(db.engine.url.database + '.write-lock' if sqlite_file else None)
+
 from datetime import datetime
+from sqlalchemy import and_, case, delete, event, exists, func, inspect, insert, or_, select, text, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import validates
+
+def normalize_category(name):
+    # Same hyphen-to-space handling as the category route, so "operating-systems" and "Operating Systems" share a key
+    if not name:
+        return None
+    return ' '.join(name.replace('-', ' ').split()).lower()
 
 class Content(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -32,134 +106,558 @@ class Content(db.Model):
     url = db.Column(db.String(255), nullable=False)
     category = db.Column(db.String(100), nullable=True)
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    canonical_url = db.Column(db.String(255), nullable=True, index=True)
+    category_key = db.Column(db.String(100), nullable=True, index=True)
     __table_args__ = (db.UniqueConstraint('title', 'url', name='uix_title_url'),)
 
-def init_db():
-    db.create_all()
-    initial_data = [
-        { "id": 1, "title": "Kali Linux", "content": "Official Kali Linux website for penetration testing and security auditing.", "url": "https://www.kali.org/get-kali/#kali-platforms", "category": "Operating Systems" },
-        { "id": 2, "title": "Ubuntu Linux", "content": "Official Ubuntu Linux website for general purpose operating system.", "url": "https://ubuntu.com/#download-ubuntu", "category": "Operating Systems" },
-        { "id": 3, "title": "Garuda Linux", "content": "official Garuda Linux download URL directly","url": "https://garudalinux.org/editions", "category": "Operating Systems"},
-        { "id": 4, "title": "Parrot Linux", "content": "Official Parrot Linux website.", "url": "https://parrotsec.org/download/", "category": "Operating Systems"},
-        { "id": 5, "title": "Blackarch Linux", "content": "Official Blackarch linux download", "url": "https://blackarch.org/downloads.html", "category": "Operating Systems"},
-        { "id": 6, "title": "WhatsApp", "content": "Official WhatsApp download", "url": "https://www.whatsapp.com/download", "category": "Software Categories"},
-        { "id": 7, "title": "VsCode", "content": "Official Download Visual Studio Code", "url": "https://code.visualstudio.com/Download", "category": "Development"},
-        { "id": 8, "title": "Brave Browser", "content": "Official Brave Browser download", "url": "https://brave.com/", "category": "Software Categories"},
-        { "id": 9, "title": "DigiLocker", "content": "Official gov website", "url": "https://www.digilocker.gov.in/web/installapp", "category": "Software Categories"},
-        { "id": 10,"title": "Windows 11", "content": "Windows 11 Official download link", "url": "https://www.microsoft.com/en-us/software-download/windows11", "category": "Operating Systems"},
-        { "id": 11,"title": "Windows 10", "content": "Windows 10 Official download link", "url": "https://www.microsoft.com/en-us/software-download/windows10ISO", "category": "Operating Systems"},
-        { "id": 12,"title": "Vlc player", "content": "Official download link of Vlc player", "url": "https://www.videolan.org/vlc/", "category": "Multimedia"},
-        { "id": 13,"title": "Vmware", "content": "Official vmware workstation download link", "url": "https://www.vmware.com/products/desktop-hypervisor/workstation-and-fusion", "category": "Software Categories"},
-        { "id": 14,"title": "VirtualBox", "content": "Official VirtualBox download link", "url": "https://www.virtualbox.org/wiki/Downloads", "category": "Software Categories"},
-        { "id": 15,"title": "Zoom", "content": "Official Zoom download link", "url": "https://support.zoom.com/hc/en/article?id=zm_kb&sysparm_article=KB0060928", "category": "Multimedia"},
-        { "id": 16,"title": "Excel", "content": "Official Microsoft Excel download link", "url": "https://microsoft-excel.en.softonic.com/", "category": "Software Categories"},
-        { "id": 17,"title": "Chrome", "content": "Official Google Chrome download link", "url": "https://www.google.com/intl/en_in/chrome/", "category": "Software Categories"},
-        { "id": 18,"title": "Gmail", "content": "Official Gmail download link", "url": "https://play.google.com/store/apps/details?id=com.google.android.gm&hl=en_IN", "category": "Software Categories"},
-        { "id": 19,"title": "All Linux Distributions", "content": "Official All Linux download link", "url": "https://www.linux.org/pages/download/", "category": "Operating Systems"},
-        { "id": 20,"title": "Adobe Photoshop", "content": "Official Adobe Photoshop download", "url": "https://www.adobe.com/products/photoshop.html", "category": "Graphic Design"},
-        { "id": 21,"title": "GIMP", "content": "Official GIMP download", "url": "https://www.gimp.org/downloads/", "category": "Graphic Design"},
-        { "id": 23,"title": "Visual Studio", "content": "Official Visual Studio download", "url": "https://visualstudio.microsoft.com/downloads/", "category": "Development"},
-        { "id": 24,"title": "PyCharm", "content": "Official PyCharm download", "url": "https://www.jetbrains.com/pycharm/download/", "category": "Software Categories"},
-        { "id": 25,"title": "Norton Antivirus", "content": "Official Norton Antivirus download", "url": "https://us.norton.com/products", "category": "Antivirus"},
-        { "id": 26,"title": "McAfee Antivirus", "content": "Official McAfee Antivirus download", "url": "https://www.mcafee.com/en-us/antivirus.html", "category": "Antivirus"},
-        { "id": 27,"title": "Avast Antivirus", "content": "Official Avast Antivirus download", "url": "https://www.avast.com/en-us/index#pc", "category": "Antivirus"},
-        { "id": 28,"title": "Bitdefender Antivirus", "content": "Official Bitdefender Antivirus download", "url": "https://www.bitdefender.com/solutions/antivirus.html", "category": "Antivirus"},
-        { "id": 29,"title": "Kaspersky Antivirus", "content": "Official Kaspersky Antivirus download", "url": "https://www.kaspersky.com/downloads", "category": "Antivirus"},
-        { "id": 30,"title": "Trend Micro Antivirus", "content": "Official Trend Micro Antivirus download", "url": "https://www.trendmicro.com/en_us/forHome/products/antivirus-plus.html", "category": "Antivirus"},
-        { "id": 31,"title": "Slack", "content": "Official Slack download", "url": "https://slack.com/downloads/", "category": "Communication"},
-        { "id": 32,"title": "Discord", "content": "Official Discord download", "url": "https://discord.com/download", "category": "Communication"},
-        { "id": 33,"title": "Spotify", "content": "Official Spotify download", "url": "https://www.spotify.com/download", "category": "Multimedia"},
-        { "id": 34,"title": "Skype", "content": "Official Skype download", "url": "https://www.skype.com/en/get-skype/", "category": "Communication"},
-        { "id": 35,"title": "Google Drive", "content": "Official Google Drive download", "url": "https://www.google.com/drive/download/", "category": "Cloud Storage"},
-        { "id": 36,"title": "Dropbox", "content": "Official Dropbox download", "url": "https://www.dropbox.com/install", "category": "Cloud Storage"},
-        { "id": 37,"title": "OneDrive", "content": "Official OneDrive download", "url": "https://onedrive.live.com/about/en-us/download/", "category": "Cloud Storage"},
-        { "id": 38,"title": "Notepad++", "content": "Official Notepad++ download", "url": "https://notepad-plus-plus.org/downloads/", "category": "Development"},
-        { "id": 39,"title": "Git", "content": "Official Git download", "url": "https://git-scm.com/downloads", "category": "Development"},
-        { "id": 40,"title": "FileZilla", "content": "Official FileZilla download", "url": "https://filezilla-project.org/download.php", "category": "Development"},
-        { "id": 41,"title": "7-Zip", "content": "Official 7-Zip download", "url": "https://www.7-zip.org/download.html", "category": "Utilities"},
-        { "id": 42,"title": "WinRAR", "content": "Official WinRAR download", "url": "https://www.win-rar.com/download.html", "category": "Utilities"},
-        { "id": 43,"title": "CCleaner", "content": "Official CCleaner download", "url": "https://www.ccleaner.com/ccleaner/download", "category": "Utilities"},
-        { "id": 44,"title": "TeamViewer", "content": "Official TeamViewer download", "url": "https://www.teamviewer.com/en/download/", "category": "Remote Access"},
-        { "id": 45,"title": "Adobe Acrobat Reader", "content": "Official Adobe Acrobat Reader download", "url": "https://get.adobe.com/reader/", "category": "Utilities"},
-        { "id": 46,"title": "Google Chrome", "content": "Official Google Chrome download", "url": "https://www.google.com/chrome/", "category": "Software Categories"},
-        { "id": 47,"title": "Mozilla Firefox", "content": "Official Mozilla Firefox download", "url": "https://www.mozilla.org/firefox/new/", "category": "Software Categories"},
-        { "id": 48,"title": "Opera Browser", "content": "Official Opera Browser download", "url": "https://www.opera.com/download", "category": "Software Categories"},
-        { "id": 49,"title": "Amanda", "content": "Official Amanda backup software download", "url": "https://www.amanda.org/download.php", "category": "Backup Softwares"},
-        { "id": 50,"title": "Bacula", "content": "Official Bacula backup software download", "url": "https://www.bacula.org/binary-download-center/", "category": "Backup Softwares"},
-        { "id": 51,"title": "BorgBackup", "content": "Official BorgBackup backup software download", "url": "https://www.borgbackup.org/releases/", "category": "Backup Softwares"},
-        { "id": 52,"title": "Box Backup", "content": "Official Box Backup software download", "url": "https://www.box.com/en-in/pricing", "category": "Backup Softwares"},
-        { "id": 53,"title": "DAR", "content": "Official DAR backup software download", "url": "http://dar.linux.free.fr/", "category": "Backup Softwares"},
-        { "id": 54,"title": "DirSync Pro", "content": "Official DirSync Pro backup software download", "url": "https://dirsync-pro.en.lo4d.com/download", "category": "Backup Softwares"},
-        { "id": 55,"title": "Duplicati", "content": "Official Duplicati backup software download", "url": "https://www.duplicati.com/download", "category": "Backup Softwares"},
-        { "id": 56,"title": "duplicity", "content": "Official duplicity backup software download", "url": "https://sourceforge.net/projects/duplicity/", "category": "Backup Softwares"},
-        { "id": 57,"title": "FreeFileSync", "content": "Official FreeFileSync backup software download", "url": "https://freefilesync.org/download.php", "category": "Backup Softwares"},
-        { "id": 58,"title": "git-annex", "content": "Official git-annex backup software download", "url": "https://git-annex.branchable.com/install/", "category": "Backup Softwares"},
-        { "id": 59,"title": "luckyBackup", "content": "Official luckyBackup backup software download", "url": "https://luckybackup.sourceforge.net/download.html", "category": "Backup Softwares"},
-        { "id": 60,"title": "Proxmox Backup Server", "content": "Official Proxmox Backup Server software download", "url": "https://www.proxmox.com/en/products/proxmox-backup-server/get-started", "category": "Backup Softwares"},
-        { "id": 61,"title": "Restic", "content": "Official Restic backup software download", "url": "https://restic.readthedocs.io/en/stable/020_installation.html", "category": "Backup Softwares"},
-        { "id": 62,"title": "rdiff-backup", "content": "Official rdiff-backup software download", "url": "https://pypi.org/project/rdiff-backup/#files", "category": "Backup Softwares"},
-        { "id": 63,"title": "rsnapshot", "content": "Official rsnapshot backup software download", "url": "http://www.rsnapshot.org/downloads/", "category": "Backup Softwares"},
-        {"id": 64,"title": "SBackup", "content": "Official SBackup backup software download", "url": "https://community.linuxmint.com/software/view/sbackup", "category": "Backup Softwares"},
-        { "id": 65,"title": "Free Fire","content": "Official Free Fire download link", "url": "https://play.google.com/store/search?q=freefire&c=apps", "category": "Games"},
-        { "id": 66,"title": "PUBG Mobile","content": "Official PUBG Mobile download link", "url": "https://play.google.com/store/search?q=pubg%20mobile&c=apps", "category": "Games"},
-        { "id": 67,"title": "Call of Duty Mobile","content": "Official Call of Duty Mobile download link", "url": "https://play.google.com/store/search?q=call%20of%20duty&c=apps", "category": "Games"},
-        { "id": 68,"title": "Among Us","content": "Official Among Us download link", "url": "https://innersloth.com/gameAmongUs.php", "category": "Games"},
-        { "id": 69,"title": "Minecraft","content": "Official Minecraft download link", "url": "https://www.minecraft.net/en-us/download", "category": "Games"},
-        { "id": 70,"title": "League of Legends","content": "Official League of Legends download link", "url": "https://signup.leagueoflegends.com/en-us/signup/index", "category": "Games"},
-        { "id": 71,"title": "Counter-Strike: Global Offensive","content": "Official CS:GO download link", "url": "https://store.steampowered.com/app/730/CounterStrike_Global_Offensive/", "category": "Games"},
-        { "id": 72,"title": "Dota 2","content": "Official Dota 2 download link", 'url': 'https://store.steampowered.com/app/570/Dota_2/', 'category': 'Games'},
-        { 'id': 73, 'title': 'Apex Legends', 'content': 'Official Apex Legends download link', 'url': 'https://www.ea.com/games/apex-legends/download', 'category': 'Games' },
-        { 'id': 74, 'title': 'Fortnite', 'content': 'Official Fortnite download link', 'url': 'https://www.epicgames.com/fortnite/en-US/download', 'category': 'Games' },
-        { 'id': 75, 'title': 'Valorant', 'content': 'Official Valorant download link', 'url': 'https://playvalorant.com/en-us/download/', 'category': 'Games' },
-        
-    ]
-        
-    for item in initial_data:
-        existing = Content.query.filter_by(title=item['title'], url=item['url']).first()
-        if not existing:
-            existing_by_id = Content.query.filter_by(id=item['id']).first()
-            if existing_by_id:
-                existing_by_id.title = item['title']
-                existing_by_id.content = item['content']
-                existing_by_id.url = item['url']
-                existing_by_id.category = item['category']
-                existing_by_id.created_at = datetime.utcnow()
+    @validates('url')
+    def _sync_canonical_url(self, key, url):
+        self.canonical_url = canonicalize_url(url)
+        return url
+
+    @validates('category')
+    def _sync_category_key(self, key, category):
+        self.category_key = normalize_category(category)
+        return category
+
+class CategoryCount(db.Model):
+    # Per-category row counts, adjusted by each write instead of counted per request
+    __tablename__ = 'category_count'
+    key = db.Column(db.String(100), primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+def adjust_category_count(category, delta):
+    key = normalize_category(category)
+    if key is None:
+        return
+    updated = db.session.execute(
+        update(CategoryCount).where(CategoryCount.key == key).values(count=CategoryCount.count + delta)
+    ).rowcount
+    if not updated:
+        db.session.add(CategoryCount(key=key, name=category, count=max(delta, 0)))
+
+def rebuild_category_counts():
+    db.session.execute(delete(CategoryCount))
+    db.session.execute(insert(CategoryCount).from_select(
+        ['key', 'name', 'count'],
+        select(Content.category_key, func.min(Content.category), func.count(Content.id))
+        .where(Content.category_key.isnot(None))
+        .group_by(Content.category_key)
+    ))
+
+class AppState(db.Model):
+    __tablename__ = 'app_state'
+    key = db.Column(db.String(64), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+class LinkStatus(db.Model):
+    # Latest link-check result per content row; a result only counts while url still matches the row's url
+    __tablename__ = 'link_status'
+    content_id = db.Column(db.Integer, primary_key=True)
+    url = db.Column(db.String(255), nullable=False)
+    ok = db.Column(db.Boolean, nullable=False, index=True)
+    status_code = db.Column(db.Integer, nullable=True)
+    final_url = db.Column(db.String(2048), nullable=True)
+    latency_ms = db.Column(db.Float, nullable=True)
+    error = db.Column(db.String(255), nullable=True)
+    checked_at = db.Column(db.DateTime, nullable=False)
+
+class ContentChange(db.Model):
+    # Content ids written at each data version, replayed by the other workers onto their search index
+    __tablename__ = 'content_change'
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, index=True)
+    # NULL marks a write that was not logged row by row (e.g. the seed); readers rebuild instead
+    content_id = db.Column(db.Integer, nullable=True)
+
+DATA_VERSION_KEY = 'data_version'
+SEED_FINGERPRINT_KEY = 'seed_fingerprint'
+# Versions kept in the change log; a worker further behind than this rebuilds its index
+CHANGE_LOG_RETENTION = 1000
+
+def get_data_version():
+    # The version lives in the database so every gunicorn worker sees the other workers' writes
+    if 'data_version' not in g:
+        g.data_version = db.session.query(AppState.value).filter_by(key=DATA_VERSION_KEY).scalar() or 0
+    return g.data_version
+
+def bump_data_version():
+    # Call before committing a write so the bump lands in the same transaction
+    state = db.session.get(AppState, DATA_VERSION_KEY)
+    if state is None:
+        state = AppState(key=DATA_VERSION_KEY, value=0)
+        db.session.add(state)
+    state.value = AppState.value + 1 if state.value else 1
+    db.session.flush()
+    g.data_version = db.session.query(AppState.value).filter_by(key=DATA_VERSION_KEY).scalar()
+    return g.data_version
+
+def log_content_changes(version, content_ids):
+    """Record the rows a write touched, in the write's transaction; None makes other workers rebuild."""
+    ids = [None] if content_ids is None else list(content_ids)
+    if ids:
+        db.session.execute(insert(ContentChange), [{"version": version, "content_id": content_id} for content_id in ids])
+    db.session.execute(delete(ContentChange).where(ContentChange.version <= version - CHANGE_LOG_RETENTION))
+
+search_index = SearchIndex()
+# Title/category autocomplete; rebuilt and patched together with search_index, whose version it shares
+suggest_index = PrefixIndex()
+
+def category_counts():
+    return db.session.execute(select(CategoryCount.name, CategoryCount.count).where(CategoryCount.count > 0)).all()
+
+def build_search_index():
+    version = get_data_version()
+    rows = db.session.query(Content.id, Content.title, Content.content, Content.url).all()
+    search_index.build(rows, version)
+    suggest_index.build(((row.id, row.title) for row in rows), category_counts())
+    logger.info(f"Search index built with {len(search_index)} entries at data version {version}")
+
+# Held by whichever thread is building the index from scratch, or replaying the change log
+search_rebuild_lock = threading.Lock()
+search_sync_lock = threading.Lock()
+
+def get_search_index():
+    """Return the search index, caught up with the current data version where possible.
+
+    A cold worker builds inside the request, or waits for the warm-up build to finish. Afterwards, other workers' writes are
+    replayed from the change log, and gaps the log cannot cover trigger a rebuild on a
+    background thread while the current index keeps serving.
+    """
+    if not search_index.ready:
+        with search_rebuild_lock:
+            if not search_index.ready:
+                build_search_index()
+    elif search_index.version < get_data_version():
+        sync_search_index(get_data_version())
+    return search_index
+
+def sync_search_index(version):
+    if not search_sync_lock.acquire(blocking=False):
+        return
+    try:
+        since = search_index.version
+        if since >= version:
+            return
+        if version - since >= CHANGE_LOG_RETENTION:
+            start_search_index_rebuild()
+            return
+        changed = set(db.session.execute(
+            select(ContentChange.content_id).where(ContentChange.version > since, ContentChange.version <= version)
+        ).scalars())
+        if None in changed:
+            start_search_index_rebuild()
+            return
+        ids = sorted(changed)
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[start:start + BULK_CHUNK_SIZE]
+            rows = {row.id: row for row in db.session.execute(select(*LIST_COLUMNS).where(Content.id.in_(chunk)))}
+            for content_id in chunk:
+                row = rows.get(content_id)
+                if row is None:
+                    search_index.remove(content_id)
+                    suggest_index.remove(content_id)
+                else:
+                    search_index.add(*row)
+                    suggest_index.add(row.id, row.title)
+        if ids:
+            suggest_index.set_categories(category_counts())
+        search_index.version = version
+    finally:
+        search_sync_lock.release()
+
+def start_search_index_rebuild():
+    if not search_rebuild_lock.acquire(blocking=False):
+        return
+
+    def rebuild():
+        try:
+            with app.app_context():
+                build_search_index()
+        except Exception:
+            logger.exception("Search index rebuild failed")
+        finally:
+            search_rebuild_lock.release()
+
+    threading.Thread(target=rebuild, name='search-index-rebuild', daemon=True).start()
+
+def warm_search_index():
+    # Called from gunicorn's post_worker_init. The build runs on a background thread so a large catalog
+    # cannot hold the worker past its boot timeout; a /search that arrives first waits on search_rebuild_lock.
+    start_search_index_rebuild()
+
+def patch_search_index(version, added=(), removed=()):
+    # Apply a local write incrementally; if another worker wrote in between, the change log is replayed on next use instead
+    if not search_index.ready or search_index.version != version - 1:
+        return
+    for row in added:
+        search_index.add(*row)
+        suggest_index.add(row[0], row[1])
+    for content_id in removed:
+        search_index.remove(content_id)
+        suggest_index.remove(content_id)
+    suggest_index.set_categories(category_counts())
+    search_index.version = version
+
+response_cache = ResponseCache(
+    app.config['RESPONSE_CACHE_MAX_ENTRIES'], app.config['RESPONSE_CACHE_TTL'],
+    app.config['RESPONSE_CACHE_MAX_BYTES'], app.config['RESPONSE_CACHE_MAX_ENTRY_BYTES']
+)
+
+def accepts_gzip():
+    return request.accept_encodings['gzip'] > 0
+
+def worth_compressing(mimetype, size):
+    return size >= app.config['COMPRESS_MIN_SIZE'] and is_compressible(mimetype)
+
+def cached_response(*arg_names):
+    """Serve a GET view from the response cache while the data version is unchanged, with ETag/304 support.
+
+    arg_names lists the query args the view reads; only those are part of the cache key.
+    The gzip variant is stored alongside the body, so each entry is compressed at most once.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            version = get_data_version()
+            key = make_key(request.path, request.args, arg_names)
+            entry = response_cache.get(key, version)
+            if entry is None:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.is_streamed:
+                    return response
+                body = response.get_data()
+                if not response_cache.cacheable(len(body)):
+                    return response
+                entry = CachedResponse(body=body, mimetype=response.mimetype, etag=make_etag(body))
+                response_cache.set(key, version, entry)
+            compressible = worth_compressing(entry.mimetype, len(entry.body))
+            gzip_ok = compressible and accepts_gzip()
+            if gzip_ok and entry.gzip_body is None:
+                entry = entry._replace(gzip_body=gzip_bytes(entry.body, app.config['COMPRESS_LEVEL']))
+                response_cache.set(key, version, entry)
+            # Same ETag scheme as the static assets: the gzip representation gets its own tag
+            etag = entry.etag + '-gz' if gzip_ok else entry.etag
+            if etag in request.if_none_match:
+                response = Response(status=304)
             else:
-                content = Content(title=item['title'], content=item['content'], url=item['url'], category=item['category'], created_at=datetime.utcnow())
-                db.session.add(content)
-        else:
-            existing.title = item['title']
-            existing.content = item['content']
-            existing.url = item['url']
-            existing.category = item['category']
-            existing.created_at = datetime.utcnow()
+                response = Response(entry.gzip_body if gzip_ok else entry.body, mimetype=entry.mimetype)
+                if gzip_ok:
+                    response.headers['Content-Encoding'] = 'gzip'
+            response.set_etag(etag)
+            if compressible:
+                response.vary.add('Accept-Encoding')
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
+
+INITIAL_DATA = [
+    { "id": 1, "title": "Kali Linux", "content": "Official Kali Linux website for penetration testing and security auditing.", "url": "https://www.kali.org/get-kali/#kali-platforms", "category": "Operating Systems" },
+    { "id": 2, "title": "Ubuntu Linux", "content": "Official Ubuntu Linux website for general purpose operating system.", "url": "https://ubuntu.com/#download-ubuntu", "category": "Operating Systems" },
+    { "id": 3, "title": "Garuda Linux", "content": "official Garuda Linux download URL directly","url": "https://garudalinux.org/editions", "category": "Operating Systems"},
+    { "id": 4, "title": "Parrot Linux", "content": "Official Parrot Linux website.", "url": "https://parrotsec.org/download/", "category": "Operating Systems"},
+    { "id": 5, "title": "Blackarch Linux", "content": "Official Blackarch linux download", "url": "https://blackarch.org/downloads.html", "category": "Operating Systems"},
+    { "id": 6, "title": "WhatsApp", "content": "Official WhatsApp download", "url": "https://www.whatsapp.com/download", "category": "Software Categories"},
+    { "id": 7, "title": "VsCode", "content": "Official Download Visual Studio Code", "url": "https://code.visualstudio.com/Download", "category": "Development"},
+    { "id": 8, "title": "Brave Browser", "content": "Official Brave Browser download", "url": "https://brave.com/", "category": "Software Categories"},
+    { "id": 9, "title": "DigiLocker", "content": "Official gov website", "url": "https://www.digilocker.gov.in/web/installapp", "category": "Software Categories"},
+    { "id": 10,"title": "Windows 11", "content": "Windows 11 Official download link", "url": "https://www.microsoft.com/en-us/software-download/windows11", "category": "Operating Systems"},
+    { "id": 11,"title": "Windows 10", "content": "Windows 10 Official download link", "url": "https://www.microsoft.com/en-us/software-download/windows10ISO", "category": "Operating Systems"},
+    { "id": 12,"title": "Vlc player", "content": "Official download link of Vlc player", "url": "https://www.videolan.org/vlc/", "category": "Multimedia"},
+    { "id": 13,"title": "Vmware", "content": "Official vmware workstation download link", "url": "https://www.vmware.com/products/desktop-hypervisor/workstation-and-fusion", "category": "Software Categories"},
+    { "id": 14,"title": "VirtualBox", "content": "Official VirtualBox download link", "url": "https://www.virtualbox.org/wiki/Downloads", "category": "Software Categories"},
+    { "id": 15,"title": "Zoom", "content": "Official Zoom download link", "url": "https://support.zoom.com/hc/en/article?id=zm_kb&sysparm_article=KB0060928", "category": "Multimedia"},
+    { "id": 16,"title": "Excel", "content": "Official Microsoft Excel download link", "url": "https://microsoft-excel.en.softonic.com/", "category": "Software Categories"},
+    { "id": 17,"title": "Chrome", "content": "Official Google Chrome download link", "url": "https://www.google.com/intl/en_in/chrome/", "category": "Software Categories"},
+    { "id": 18,"title": "Gmail", "content": "Official Gmail download link", "url": "https://play.google.com/store/apps/details?id=com.google.android.gm&hl=en_IN", "category": "Software Categories"},
+    { "id": 19,"title": "All Linux Distributions", "content": "Official All Linux download link", "url": "https://www.linux.org/pages/download/", "category": "Operating Systems"},
+    { "id": 20,"title": "Adobe Photoshop", "content": "Official Adobe Photoshop download", "url": "https://www.adobe.com/products/photoshop.html", "category": "Graphic Design"},
+    { "id": 21,"title": "GIMP", "content": "Official GIMP download", "url": "https://www.gimp.org/downloads/", "category": "Graphic Design"},
+    { "id": 23,"title": "Visual Studio", "content": "Official Visual Studio download", "url": "https://visualstudio.microsoft.com/downloads/", "category": "Development"},
+    { "id": 24,"title": "PyCharm", "content": "Official PyCharm download", "url": "https://www.jetbrains.com/pycharm/download/", "category": "Software Categories"},
+    { "id": 25,"title": "Norton Antivirus", "content": "Official Norton Antivirus download", "url": "https://us.norton.com/products", "category": "Antivirus"},
+    { "id": 26,"title": "McAfee Antivirus", "content": "Official McAfee Antivirus download", "url": "https://www.mcafee.com/en-us/antivirus.html", "category": "Antivirus"},
+    { "id": 27,"title": "Avast Antivirus", "content": "Official Avast Antivirus download", "url": "https://www.avast.com/en-us/index#pc", "category": "Antivirus"},
+    { "id": 28,"title": "Bitdefender Antivirus", "content": "Official Bitdefender Antivirus download", "url": "https://www.bitdefender.com/solutions/antivirus.html", "category": "Antivirus"},
+    { "id": 29,"title": "Kaspersky Antivirus", "content": "Official Kaspersky Antivirus download", "url": "https://www.kaspersky.com/downloads", "category": "Antivirus"},
+    { "id": 30,"title": "Trend Micro Antivirus", "content": "Official Trend Micro Antivirus download", "url": "https://www.trendmicro.com/en_us/forHome/products/antivirus-plus.html", "category": "Antivirus"},
+    { "id": 31,"title": "Slack", "content": "Official Slack download", "url": "https://slack.com/downloads/", "category": "Communication"},
+    { "id": 32,"title": "Discord", "content": "Official Discord download", "url": "https://discord.com/download", "category": "Communication"},
+    { "id": 33,"title": "Spotify", "content": "Official Spotify download", "url": "https://www.spotify.com/download", "category": "Multimedia"},
+    { "id": 34,"title": "Skype", "content": "Official Skype download", "url": "https://www.skype.com/en/get-skype/", "category": "Communication"},
+    { "id": 35,"title": "Google Drive", "content": "Official Google Drive download", "url": "https://www.google.com/drive/download/", "category": "Cloud Storage"},
+    { "id": 36,"title": "Dropbox", "content": "Official Dropbox download", "url": "https://www.dropbox.com/install", "category": "Cloud Storage"},
+    { "id": 37,"title": "OneDrive", "content": "Official OneDrive download", "url": "https://onedrive.live.com/about/en-us/download/", "category": "Cloud Storage"},
+    { "id": 38,"title": "Notepad++", "content": "Official Notepad++ download", "url": "https://notepad-plus-plus.org/downloads/", "category": "Development"},
+    { "id": 39,"title": "Git", "content": "Official Git download", "url": "https://git-scm.com/downloads", "category": "Development"},
+    { "id": 40,"title": "FileZilla", "content": "Official FileZilla download", "url": "https://filezilla-project.org/download.php", "category": "Development"},
+    { "id": 41,"title": "7-Zip", "content": "Official 7-Zip download", "url": "https://www.7-zip.org/download.html", "category": "Utilities"},
+    { "id": 42,"title": "WinRAR", "content": "Official WinRAR download", "url": "https://www.win-rar.com/download.html", "category": "Utilities"},
+    { "id": 43,"title": "CCleaner", "content": "Official CCleaner download", "url": "https://www.ccleaner.com/ccleaner/download", "category": "Utilities"},
+    { "id": 44,"title": "TeamViewer", "content": "Official TeamViewer download", "url": "https://www.teamviewer.com/en/download/", "category": "Remote Access"},
+    { "id": 45,"title": "Adobe Acrobat Reader", "content": "Official Adobe Acrobat Reader download", "url": "https://get.adobe.com/reader/", "category": "Utilities"},
+    { "id": 46,"title": "Google Chrome", "content": "Official Google Chrome download", "url": "https://www.google.com/chrome/", "category": "Software Categories"},
+    { "id": 47,"title": "Mozilla Firefox", "content": "Official Mozilla Firefox download", "url": "https://www.mozilla.org/firefox/new/", "category": "Software Categories"},
+    { "id": 48,"title": "Opera Browser", "content": "Official Opera Browser download", "url": "https://www.opera.com/download", "category": "Software Categories"},
+    { "id": 49,"title": "Amanda", "content": "Official Amanda backup software download", "url": "https://www.amanda.org/download.php", "category": "Backup Softwares"},
+    { "id": 50,"title": "Bacula", "content": "Official Bacula backup software download", "url": "https://www.bacula.org/binary-download-center/", "category": "Backup Softwares"},
+    { "id": 51,"title": "BorgBackup", "content": "Official BorgBackup backup software download", "url": "https://www.borgbackup.org/releases/", "category": "Backup Softwares"},
+    { "id": 52,"title": "Box Backup", "content": "Official Box Backup software download", "url": "https://www.box.com/en-in/pricing", "category": "Backup Softwares"},
+    { "id": 53,"title": "DAR", "content": "Official DAR backup software download", "url": "http://dar.linux.free.fr/", "category": "Backup Softwares"},
+    { "id": 54,"title": "DirSync Pro", "content": "Official DirSync Pro backup software download", "url": "https://dirsync-pro.en.lo4d.com/download", "category": "Backup Softwares"},
+    { "id": 55,"title": "Duplicati", "content": "Official Duplicati backup software download", "url": "https://www.duplicati.com/download", "category": "Backup Softwares"},
+    { "id": 56,"title": "duplicity", "content": "Official duplicity backup software download", "url": "https://sourceforge.net/projects/duplicity/", "category": "Backup Softwares"},
+    { "id": 57,"title": "FreeFileSync", "content": "Official FreeFileSync backup software download", "url": "https://freefilesync.org/download.php", "category": "Backup Softwares"},
+    { "id": 58,"title": "git-annex", "content": "Official git-annex backup software download", "url": "https://git-annex.branchable.com/install/", "category": "Backup Softwares"},
+    { "id": 59,"title": "luckyBackup", "content": "Official luckyBackup backup software download", "url": "https://luckybackup.sourceforge.net/download.html", "category": "Backup Softwares"},
+    { "id": 60,"title": "Proxmox Backup Server", "content": "Official Proxmox Backup Server software download", "url": "https://www.proxmox.com/en/products/proxmox-backup-server/get-started", "category": "Backup Softwares"},
+    { "id": 61,"title": "Restic", "content": "Official Restic backup software download", "url": "https://restic.readthedocs.io/en/stable/020_installation.html", "category": "Backup Softwares"},
+    { "id": 62,"title": "rdiff-backup", "content": "Official rdiff-backup software download", "url": "https://pypi.org/project/rdiff-backup/#files", "category": "Backup Softwares"},
+    { "id": 63,"title": "rsnapshot", "content": "Official rsnapshot backup software download", "url": "http://www.rsnapshot.org/downloads/", "category": "Backup Softwares"},
+    {"id": 64,"title": "SBackup", "content": "Official SBackup backup software download", "url": "https://community.linuxmint.com/software/view/sbackup", "category": "Backup Softwares"},
+    { "id": 65,"title": "Free Fire","content": "Official Free Fire download link", "url": "https://play.google.com/store/search?q=freefire&c=apps", "category": "Games"},
+    { "id": 66,"title": "PUBG Mobile","content": "Official PUBG Mobile download link", "url": "https://play.google.com/store/search?q=pubg%20mobile&c=apps", "category": "Games"},
+    { "id": 67,"title": "Call of Duty Mobile","content": "Official Call of Duty Mobile download link", "url": "https://play.google.com/store/search?q=call%20of%20duty&c=apps", "category": "Games"},
+    { "id": 68,"title": "Among Us","content": "Official Among Us download link", "url": "https://innersloth.com/gameAmongUs.php", "category": "Games"},
+    { "id": 69,"title": "Minecraft","content": "Official Minecraft download link", "url": "https://www.minecraft.net/en-us/download", "category": "Games"},
+    { "id": 70,"title": "League of Legends","content": "Official League of Legends download link", "url": "https://signup.leagueoflegends.com/en-us/signup/index", "category": "Games"},
+    { "id": 71,"title": "Counter-Strike: Global Offensive","content": "Official CS:GO download link", "url": "https://store.steampowered.com/app/730/CounterStrike_Global_Offensive/", "category": "Games"},
+    { "id": 72,"title": "Dota 2","content": "Official Dota 2 download link", 'url': 'https://store.steampowered.com/app/570/Dota_2/', 'category': 'Games'},
+    { 'id': 73, 'title': 'Apex Legends', 'content': 'Official Apex Legends download link', 'url': 'https://www.ea.com/games/apex-legends/download', 'category': 'Games' },
+    { 'id': 74, 'title': 'Fortnite', 'content': 'Official Fortnite download link', 'url': 'https://www.epicgames.com/fortnite/en-US/download', 'category': 'Games' },
+    { 'id': 75, 'title': 'Valorant', 'content': 'Official Valorant download link', 'url': 'https://playvalorant.com/en-us/download/', 'category': 'Games' },
+    
+]
+
+def seed_fingerprint():
+    # AppState stores integers, so keep the first 60 bits of the digest
+    digest = hashlib.sha256(json.dumps(INITIAL_DATA, sort_keys=True).encode()).hexdigest()
+    return int(digest[:15], 16)
+
+def dialect_insert(model):
+    # The dialect-specific insert() is the one that supports ON CONFLICT
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
+
+def upsert_statement(rows):
+    """Build one INSERT ... ON CONFLICT (title, url) DO UPDATE statement for a list of content dicts."""
+    stmt = dialect_insert(Content).values([
+        dict(row, canonical_url=canonicalize_url(row['url']), category_key=normalize_category(row.get('category')))
+        for row in rows
+    ])
+    return stmt.on_conflict_do_update(
+        index_elements=['title', 'url'],
+        set_={"content": stmt.excluded.content, "category": stmt.excluded.category, "category_key": stmt.excluded.category_key}
+    )
+
+def ensure_schema():
+    """Create missing tables, then add columns and indexes introduced after the content table was created.
+
+    create_all() never alters an existing table, so deployed SQLite files need this on bootstrap.
+    """
+    db.create_all()
+    table = Content.__table__
+    existing = {column['name'] for column in inspect(db.engine).get_columns(table.name)}
+    for column in table.columns:
+        if column.name not in existing:
+            column_type = column.type.compile(db.engine.dialect)
+            db.session.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            logger.info(f"Added column {table.name}.{column.name}")
+    db.session.commit()
+    for index in table.indexes:
+        index.create(db.engine, checkfirst=True)
+    backfill_derived_columns()
+
+def backfill_derived_columns():
+    missing = db.session.query(Content.id, Content.url, Content.category).filter(or_(
+        Content.canonical_url.is_(None),
+        and_(Content.category.isnot(None), Content.category_key.is_(None))
+    )).all()
+    if missing:
+        db.session.execute(update(Content), [
+            {"id": content_id, "canonical_url": canonicalize_url(url), "category_key": normalize_category(category)}
+            for content_id, url, category in missing
+        ])
+        db.session.commit()
+
+def init_db(force=False):
+    """Create tables and upsert the seed rows; skipped when the seed fingerprint is unchanged.
+
+    Returns True when the seed was applied.
+    """
+    ensure_schema()
+    fingerprint = seed_fingerprint()
+    state = db.session.get(AppState, SEED_FINGERPRINT_KEY)
+    if state is not None and state.value == fingerprint and not force:
+        return False
+    now = datetime.utcnow()
+    rows = [{"title": item['title'], "content": item['content'], "url": item['url'], "category": item['category'], "created_at": now} for item in INITIAL_DATA]
+    db.session.execute(upsert_statement(rows))
+    if state is None:
+        db.session.add(AppState(key=SEED_FINGERPRINT_KEY, value=fingerprint))
+    else:
+        state.value = fingerprint
+    version = bump_data_version()
+    log_content_changes(version, None)
     db.session.commit()
+    return True
+
+
+# Page sizes above MAX_PER_PAGE are capped; MAX_PAGE keeps the OFFSET within SQLite's 64-bit INTEGER
+MAX_PER_PAGE = 1000
+SQLITE_MAX_INT = 2 ** 63 - 1
+MAX_PAGE = SQLITE_MAX_INT // MAX_PER_PAGE
+
+def page_bounds(page, per_page):
+    return min(max(page, 1), MAX_PAGE), min(max(per_page, 1), MAX_PER_PAGE)
+
+def encode_cursor(position):
+    raw = json.dumps(position, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        return None
+    return position if isinstance(position, dict) else None
+
+def invalid_cursor_response():
+    return jsonify({"success": False, "message": "Invalid cursor"}), 400
+
+LINK_STATES = ('ok', 'broken', 'unchecked')
 
-from sqlalchemy import func
+def link_state_clause(state):
+    # A row whose URL changed since its last check counts as unchecked
+    checked = and_(LinkStatus.content_id == Content.id, LinkStatus.url == Content.url)
+    if state == 'unchecked':
+        return ~exists().where(checked)
+    return exists().where(checked, LinkStatus.ok == (state == 'ok'))
+
+def link_status_filters():
+    """Filters for the optional ?link_status=ok|broken|unchecked listing parameter; None when the value is invalid."""
+    state = request.args.get('link_status')
+    if not state:
+        return ()
+    if state not in LINK_STATES:
+        return None
+    return (link_state_clause(state),)
+
+def invalid_link_status_response():
+    return jsonify({"success": False, "message": 'link_status must be one of "ok", "broken" or "unchecked"'}), 400
+
+# Listing endpoints select these columns as plain rows instead of hydrating Content objects
+LIST_COLUMNS = (Content.id, Content.title, Content.content, Content.url)
+EXPORT_COLUMNS = LIST_COLUMNS + (Content.category,)
+CATEGORY_COLUMNS = EXPORT_COLUMNS + (Content.created_at.label('timestamp'),)
+
+def fetch_dicts(stmt):
+    return rows_to_dicts(db.session.execute(stmt))
+
+def json_response(payload, status=200):
+    return Response(dumps(payload), status=status, mimetype='application/json')
+
+def arg_flag(name, default=True):
+    value = request.args.get(name)
+    if value is None:
+        return default
+    return value.lower() not in ('0', 'false', 'no', 'off')
+
+# Query args read by the paginated listings; also the response cache key for them
+LISTING_ARGS = ('page', 'per_page', 'cursor', 'with_total', 'link_status')
+# Args carried over into next_page links besides the page position
+PAGE_LINK_ARGS = ('with_total', 'link_status', 'state')
+
+def next_page_url(path, **position):
+    extra = [(name, value) for name in PAGE_LINK_ARGS for value in request.args.getlist(name)]
+    return f"{path}?{urlencode(list(position.items()) + extra)}"
+
+def keyset_paginate(columns, filters, path, per_page, total=None):
+    """Paginate an id-ordered query by opaque cursor (keyset on id) or by page number.
+
+    Fetches one extra row to detect a next page instead of paginate()'s COUNT(*);
+    the total is only counted when with_total is not disabled and no precomputed total is given.
+    Returns None when the cursor cannot be decoded or its id is out of range.
+    """
+    cursor = request.args.get('cursor')
+    page, per_page = page_bounds(request.args.get('page', default=1, type=int), per_page)
+    ordered = select(*columns).where(*filters).order_by(Content.id)
+    if cursor:
+        position = decode_cursor(cursor)
+        last_id = position.get('id') if position else None
+        if not isinstance(last_id, int) or isinstance(last_id, bool) or abs(last_id) > SQLITE_MAX_INT:
+            return None
+        items = fetch_dicts(ordered.where(Content.id > last_id).limit(per_page + 1))
+    else:
+        items = fetch_dicts(ordered.offset((page - 1) * per_page).limit(per_page + 1))
+    has_next = len(items) > per_page
+    items = items[:per_page]
+    next_cursor = encode_cursor({"id": items[-1]["id"]}) if has_next else None
+    next_page = None
+    if has_next:
+        if cursor:
+            next_page = next_page_url(path, cursor=next_cursor, per_page=per_page)
+        else:
+            next_page = next_page_url(path, page=page + 1, per_page=per_page)
+    pages = None
+    if not arg_flag('with_total'):
+        total = None
+    else:
+        if total is None:
+            total = db.session.execute(select(func.count(Content.id)).where(*filters)).scalar()
+        pages = (total + per_page - 1) // per_page
+    return {
+        "page": None if cursor else page,
+        "per_page": per_page,
+        "total": total,
+        "pages": pages,
+        "next_page": next_page,
+        "next_cursor": next_cursor,
+        "items": items
+    }
 
 @app.route('/content/category/<string:category_name>', methods=['GET'])
+@cached_response(*LISTING_ARGS)
 def get_content_by_category(category_name):
-    page = request.args.get('page', default=1, type=int)
     per_page = request.args.get('per_page', default=10, type=int)
-    # Replace hyphens with spaces and do case-insensitive match
-    category_name_normalized = category_name.replace('-', ' ')
-    contents = Content.query.filter(func.lower(Content.category) == func.lower(category_name_normalized)).paginate(page=page, per_page=per_page, error_out=False)
-    data = [{"id": c.id, "title": c.title, "content": c.content, "url": c.url, "category": c.category, "timestamp": c.created_at.isoformat()} for c in contents.items]
-    next_page = None
-    if contents.has_next:
-        next_page = f"/content/category/{category_name}?page={contents.next_num}&per_page={per_page}"
-    return jsonify({
+    # Replace hyphens with spaces and match on the indexed, lowercased category key
+    key = normalize_category(category_name)
+    link_filters = link_status_filters()
+    if link_filters is None:
+        return invalid_link_status_response()
+    # The precomputed category count only applies to the unfiltered listing
+    total = None if link_filters else db.session.query(CategoryCount.count).filter_by(key=key).scalar() or 0
+    result = keyset_paginate(CATEGORY_COLUMNS, (Content.category_key == key, *link_filters), f"/content/category/{category_name}", per_page, total=total)
+    if result is None:
+        return invalid_cursor_response()
+    data = result.pop('items')
+    return json_response({
         "success": True,
         "category": category_name,
-        "page": page,
-        "per_page": per_page,
-        "total": contents.total,
-        "pages": contents.pages,
-        "next_page": next_page,
+        **result,
         "data": data
     })
 
+@app.route('/categories')
+@cached_response()
+def categories():
+    rows = db.session.execute(
+        select(CategoryCount.name, CategoryCount.key, CategoryCount.count).where(CategoryCount.count > 0).order_by(CategoryCount.name)
+    )
+    data = [{"name": name, "slug": key.replace(' ', '-'), "count": count} for name, key, count in rows]
+    return json_response({
+        "success": True,
+        "total": len(data),
+        "categories": data
+    })
+
 @app.route('/content/category/<string:category_name>', methods=['POST'])
+@write_serializer
 def add_content_to_category(category_name):
     data = request.get_json()
     if not data:
@@ -171,7 +669,11 @@ def add_content_to_category(category_name):
         return jsonify({"success": False, "message": "title, content, and url are required"}), 400
     new_content = Content(title=title, content=content_text, url=url, category=category_name)
     db.session.add(new_content)
+    adjust_category_count(category_name, 1)
+    version = bump_data_version()
+    log_content_changes(version, [new_content.id])
     db.session.commit()
+    patch_search_index(version, added=[(new_content.id, new_content.title, new_content.content, new_content.url)])
     return jsonify({"success": True, "message": f"Content added to category {category_name}", "content": {
         "id": new_content.id,
         "title": new_content.title,
@@ -180,22 +682,139 @@ def add_content_to_category(category_name):
         "category": new_content.category
     }})
 
+# Every series carries the serving worker's pid, so different gunicorn workers never report under the same series
+metrics = MetricsRegistry(const_labels=lambda: [("worker", os.getpid())])
+request_latency = metrics.histogram('easytoget_request_duration_seconds', 'Request latency by endpoint', ('endpoint', 'method'))
+requests_total = metrics.counter('easytoget_requests_total', 'Requests by endpoint and status', ('endpoint', 'method', 'status'))
+request_queries = metrics.histogram('easytoget_request_sql_queries', 'SQL statements executed per request', ('endpoint',), QUERY_COUNT_BUCKETS)
+request_query_time = metrics.histogram('easytoget_request_sql_duration_seconds', 'Total SQL time per request', ('endpoint',))
+slow_requests_total = metrics.counter('easytoget_slow_requests_total', 'Requests slower than SLOW_REQUEST_MS', ('endpoint',))
+metrics.callback_counter('easytoget_response_cache_hits_total', 'Response cache hits', lambda: response_cache.hits)
+metrics.callback_counter('easytoget_response_cache_misses_total', 'Response cache misses', lambda: response_cache.misses)
+metrics.gauge('easytoget_response_cache_hit_ratio', 'Response cache hits / lookups',
+              lambda: response_cache.hits / max(response_cache.hits + response_cache.misses, 1))
+metrics.gauge('easytoget_response_cache_entries', 'Entries held in the response cache', lambda: len(response_cache))
+metrics.gauge('easytoget_response_cache_bytes', 'Bytes of response bodies held in the response cache', lambda: response_cache.bytes)
+metrics.gauge('easytoget_search_index_documents', 'Rows held in the search index', lambda: len(search_index))
+
+with app.app_context():
+    # Listen on this app's engine rather than the Engine class, so statements from any other engine are not counted
+    sql_engine = db.engine
+
+@event.listens_for(sql_engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+@event.listens_for(sql_engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    if has_request_context() and 'sql_count' in g:
+        g.sql_count += 1
+        g.sql_time += elapsed
+
+@app.before_request
+def start_request_metrics():
+    g.request_start = time.perf_counter()
+    g.sql_count = 0
+    g.sql_time = 0.0
+
+@app.after_request
+def record_request_metrics(response):
+    if 'request_start' not in g:
+        return response
+    elapsed = time.perf_counter() - g.request_start
+    # Label by route rule rather than raw path to keep the number of series bounded
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    request_latency.observe((endpoint, request.method), elapsed)
+    requests_total.inc((endpoint, request.method, str(response.status_code)))
+    request_queries.observe((endpoint,), g.sql_count)
+    request_query_time.observe((endpoint,), g.sql_time)
+    slow_ms = app.config['SLOW_REQUEST_MS']
+    if slow_ms and elapsed * 1000 >= slow_ms:
+        slow_requests_total.inc((endpoint,))
+        logger.warning(f"Slow request: {request.method} {request.full_path.rstrip('?')} took {elapsed * 1000:.1f} ms, {g.sql_count} SQL statements in {g.sql_time * 1000:.1f} ms")
+    return response
+
 @app.before_request
 def log_request_info():
-    logger.info(f"Request: {request.method} {request.path} - Args: {request.args}")
+    g.log_sampled = should_log_request()
+    if g.log_sampled:
+        logger.info("Request", extra={"fields": {"method": request.method, "path": request.path, "args": request.args.to_dict(flat=False)}})
+
+def should_log_request():
+    if request.endpoint in app.config['LOG_EXCLUDE_ENDPOINTS']:
+        return False
+    rule = request.url_rule.rule if request.url_rule else None
+    rate = app.config['LOG_SAMPLE_RATES'].get(rule, app.config['LOG_SAMPLE_RATE'])
+    return rate >= 1.0 or random.random() < rate
+
+# Registered after record_request_metrics so that compression time is included in the request latency
+@app.after_request
+def compress_response(response):
+    """gzip dynamic responses, including streamed ones, for clients that accept it.
+
+    Cached views and static assets negotiate their own (precompressed) encoding and
+    arrive here with Content-Encoding already set when they are compressed.
+    """
+    if (not 200 <= response.status_code < 300 or response.status_code in (204, 206)
+            or 'Content-Encoding' in response.headers or request.endpoint in ('serve_react_app', 'serve_react_files')):
+        return response
+    if response.is_streamed:
+        if not is_compressible(response.mimetype):
+            return response
+    elif not worth_compressing(response.mimetype, response.calculate_content_length() or 0):
+        return response
+    response.vary.add('Accept-Encoding')
+    if not accepts_gzip():
+        return response
+    level = app.config['COMPRESS_LEVEL']
+    if response.is_streamed:
+        response.response = gzip_stream(response.response, level)
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(gzip_bytes(response.get_data(), level))
+    response.headers['Content-Encoding'] = 'gzip'
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(etag + '-gz', weak)
+    return response
+
+static_assets = StaticAssetCache(react_build_dir)
+logger.info(f"Indexed {static_assets.load()} React build files from {react_build_dir}")
+
+def asset_response(asset):
+    gzip_ok = asset.gzip_body is not None and request.accept_encodings['gzip'] > 0
+    # Each encoding is a different representation, so it needs its own strong ETag
+    etag = asset.etag + '-gz' if gzip_ok else asset.etag
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(asset.gzip_body if gzip_ok else asset.body, mimetype=asset.mimetype)
+        if gzip_ok:
+            response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(etag)
+    if asset.gzip_body is not None:
+        response.vary.add('Accept-Encoding')
+    if asset.immutable:
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    else:
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @app.route('/')
 def serve_react_app():
-    return send_from_directory(react_build_dir, 'index.html')
+    index = static_assets.get('index.html')
+    if index is None:
+        abort(404)
+    return asset_response(index)
 
 @app.route('/<path:path>')
 def serve_react_files(path):
     # Serve static files if they exist, else serve index.html for React Router
-    file_path = os.path.join(react_build_dir, path)
-    if os.path.exists(file_path):
-        return send_from_directory(react_build_dir, path)
-    else:
-        return send_from_directory(react_build_dir, 'index.html')
+    asset = static_assets.get(path) or static_assets.get('index.html')
+    if asset is None:
+        abort(404)
+    return asset_response(asset)
 
 @app.route('/api-docs')
 def api_docs():
@@ -243,10 +862,18 @@ def api_docs():
         <ul>
           <li><code>GET /content</code> - Returns all website content</li>
           <li><code>GET /content/all</code> - Returns all content without pagination</li>
+          <li><code>GET /content/all?format=ndjson</code> - Streams all content as newline-delimited JSON (<code>format=json-stream</code> streams a JSON array)</li>
           <li><code>GET /search?q=your_query</code> - Returns search results matching the query</li>
+          <li><code>GET /suggest?prefix=ka</code> - Returns up to <code>limit</code> title and category suggestions for a prefix</li>
           <li><code>GET /content/category/category_name</code> - Returns content for a specific category</li>
+          <li><code>GET /categories</code> - Returns every category with its number of entries</li>
+          <li><code>POST /content/bulk</code> - Upserts a JSON array or NDJSON stream of content items keyed on title and url</li>
+          <li><code>PUT /content/bulk/update-url</code> - Updates the URLs of many items (by id or title) in one request</li>
+          <li><code>POST /links/check</code> - Starts a background check of every download URL (<code>?wait=1</code> runs it inline)</li>
+          <li><code>GET /links/status?state=broken</code> - Returns link-check totals and, with <code>state</code>, the matching rows</li>
           <li><code>GET /api-docs/json</code> - Returns API documentation in JSON format</li>
           <li><code>GET /health</code> - Returns API health status</li>
+          <li><code>GET /metrics</code> - Returns request latency, SQL and cache metrics in Prometheus text format</li>
         </ul>
       </body>
     </html>
@@ -258,80 +885,157 @@ def api_docs_json():
         "endpoints": {
             "/content": "GET - Returns all website content",
             "/content/all": "GET - Returns all content without pagination",
+            "/content/all?format=ndjson|json-stream": "GET - Streams all content as NDJSON or a streamed JSON array",
             "/content/category/{category_name}": "GET - Returns content for a specific category",
+            "/categories": "GET - Returns every category with its number of entries",
             "/search?q=your_query": "GET - Returns search results matching the query",
-            "/health": "GET - Returns API health status"
+            "/suggest?prefix=ka": "GET - Returns up to limit title and category suggestions for a prefix",
+            "/content/bulk": "POST - Upserts a JSON array or NDJSON stream of content items keyed on title and url",
+            "/content/bulk/update-url": "PUT - Updates the URLs of many items (by id or title) in one request",
+            "/links/check": "POST - Starts a background check of every download URL (?wait=1 runs it inline)",
+            "/links/status?state=ok|broken|unchecked": "GET - Returns link-check totals and, with state, the matching rows",
+            "/health": "GET - Returns API health status",
+            "/metrics": "GET - Returns request latency, SQL and cache metrics in Prometheus text format"
         },
         "description": "EasyToGet backend API for website content retrieval and search"
     })
 
 @app.route('/content')
+@cached_response(*LISTING_ARGS)
 def content():
-    page = request.args.get('page', default=1, type=int)
     per_page = request.args.get('per_page', default=10, type=int)
-    contents = Content.query.paginate(page=page, per_page=per_page, error_out=False)
-    data = [{"id": c.id, "title": c.title, "content": c.content, "url": c.url} for c in contents.items]
-    next_page = None
-    if contents.has_next:
-        next_page = f"/content?page={contents.next_num}&per_page={per_page}"
-    return jsonify({
+    link_filters = link_status_filters()
+    if link_filters is None:
+        return invalid_link_status_response()
+    result = keyset_paginate(LIST_COLUMNS, link_filters, "/content", per_page)
+    if result is None:
+        return invalid_cursor_response()
+    data = result.pop('items')
+    return json_response({
         "success": True,
-        "page": page,
-        "per_page": per_page,
-        "total": contents.total,
-        "pages": contents.pages,
-        "next_page": next_page,
+        **result,
         "data": data
     })
 
 @app.route('/content/all')
+@cached_response('format', 'link_status')
 def content_all():
-    contents = Content.query.all()
-    data = [{"id": c.id, "title": c.title, "content": c.content, "url": c.url, "category": c.category} for c in contents]
-    return jsonify({
+    export_format = request.args.get('format', 'json')
+    link_filters = link_status_filters()
+    if link_filters is None:
+        return invalid_link_status_response()
+    if export_format in ('ndjson', 'json-stream'):
+        return stream_content_all(export_format, link_filters)
+    if export_format != 'json':
+        return jsonify({"success": False, "message": 'format must be one of "json", "ndjson" or "json-stream"'}), 400
+    data = fetch_dicts(select(*EXPORT_COLUMNS).where(*link_filters).order_by(Content.id))
+    return json_response({
         "success": True,
         "total": len(data),
         "data": data
     })
 
+STREAM_BATCH_SIZE = 1000
+
+def iter_content_rows(filters=()):
+    # yield_per keeps a bounded number of rows in memory instead of materializing the whole table
+    stmt = select(*EXPORT_COLUMNS).where(*filters).order_by(Content.id)
+    result = db.session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+    keys = tuple(result.keys())
+    for row in result:
+        yield dict(zip(keys, row))
+
+def buffered(chunks, size=STREAM_BATCH_SIZE):
+    # Join small pieces so the server writes one chunk per batch rather than one per row
+    buffer = []
+    for chunk in chunks:
+        buffer.append(chunk)
+        if len(buffer) >= size:
+            yield b''.join(buffer)
+            buffer = []
+    if buffer:
+        yield b''.join(buffer)
+
+def stream_content_all(export_format, filters=()):
+    def generate_ndjson():
+        for item in iter_content_rows(filters):
+            yield dumps(item) + b"\n"
+
+    def generate_json_array():
+        total = 0
+        yield b'{"success":true,"data":['
+        for item in iter_content_rows(filters):
+            yield (b"," if total else b"") + dumps(item)
+            total += 1
+        yield f'],"total":{total}}}'.encode()
+
+    if export_format == 'ndjson':
+        return Response(stream_with_context(buffered(generate_ndjson())), mimetype='application/x-ndjson')
+    return Response(stream_with_context(buffered(generate_json_array())), mimetype='application/json')
+
 @app.route('/search')
+@cached_response('q', 'page', 'per_page', 'cursor')
 def search():
     query = request.args.get('q', '').lower()
     if not query:
         return jsonify({"success": False, "message": 'Query parameter "q" is required'}), 400
-    page = request.args.get('page', default=1, type=int)
-    per_page = request.args.get('per_page', default=10, type=int)
-    all_results = Content.query.filter(
-        (Content.title.ilike(f"%{query}%")) |
-        (Content.content.ilike(f"%{query}%")) |
-        (Content.url.ilike(f"%{query}%"))
-    ).all()
-    # Remove duplicates by id
-    unique_results_dict = {}
-    for c in all_results:
-        unique_results_dict[c.id] = c
-    unique_results = list(unique_results_dict.values())
-    total = len(unique_results)
-    # Manual pagination
-    start = (page - 1) * per_page
+    page, per_page = page_bounds(request.args.get('page', default=1, type=int), request.args.get('per_page', default=10, type=int))
+    # Ranked keys come from the in-memory index; only the requested page is loaded from the database
+    ranked = get_search_index().search_keys(query)
+    total = len(ranked)
+    cursor = request.args.get('cursor')
+    if cursor:
+        position = decode_cursor(cursor)
+        if not position or not isinstance(position.get('s'), (int, float)) or not isinstance(position.get('id'), int):
+            return invalid_cursor_response()
+        start = bisect.bisect_right(ranked, (position['s'], position['id']))
+    else:
+        start = (page - 1) * per_page
     end = start + per_page
-    paginated_results = unique_results[start:end]
-    logger.info(f"Search query: {query}, total unique results found: {total}")
-    data = [{"id": c.id, "title": c.title, "content": c.content, "url": c.url} for c in paginated_results]
+    page_ids = [doc_id for _, doc_id in ranked[start:end]]
+    rows = {row["id"]: row for row in fetch_dicts(select(*LIST_COLUMNS).where(Content.id.in_(page_ids)))} if page_ids else {}
+    data = [rows[i] for i in page_ids if i in rows]
+    if g.get('log_sampled'):
+        logger.info("Search", extra={"fields": {"query": query, "total": total}})
+    next_cursor = None
+    if end < total:
+        score, last_id = ranked[end - 1]
+        next_cursor = encode_cursor({"s": score, "id": last_id})
     pages = (total + per_page - 1) // per_page
-    return jsonify({
+    return json_response({
         "success": True,
-        "page": page,
+        "page": None if cursor else page,
         "per_page": per_page,
         "total": total,
         "pages": pages,
+        "next_cursor": next_cursor,
         "data": data
     })
 
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+
+@app.route('/suggest')
+def suggest():
+    prefix = request.args.get('prefix', '')
+    if not prefix.strip():
+        return jsonify({"success": False, "message": 'Query parameter "prefix" is required'}), 400
+    limit = min(max(request.args.get('limit', default=SUGGEST_DEFAULT_LIMIT, type=int), 1), SUGGEST_MAX_LIMIT)
+    get_search_index()
+    return json_response({
+        "success": True,
+        "prefix": prefix,
+        "suggestions": suggest_index.suggest(prefix, limit)
+    })
+
 @app.route('/health')
 def health():
     return jsonify({"success": True, "message": "API is healthy"})
 
+@app.route('/metrics')
+def metrics_endpoint():
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.errorhandler(404)
 def not_found(e):
     logger.warning(f"404 Not Found: {request.method} {request.path}")
@@ -343,6 +1047,7 @@ def internal_error(e):
     return jsonify({"success": False, "message": "Internal server error"}), 500
 
 @app.route('/content/update-url', methods=['PUT'])
+@write_serializer
 def update_content_url():
     data = request.get_json()
     if not data:
@@ -362,30 +1067,211 @@ def update_content_url():
     if not query:
         return jsonify({"success": False, "message": "Content not found"}), 404
     query.url = new_url
+    version = bump_data_version()
+    log_content_changes(version, [query.id])
     db.session.commit()
+    patch_search_index(version, added=[(query.id, query.title, query.content, query.url)])
     return jsonify({"success": True, "message": "URL updated successfully", "content": {
         "id": query.id,
         "title": query.title,
         "url": query.url
     }})
 
+BULK_CHUNK_SIZE = 500
+
+def iter_bulk_items():
+    """Yield (index, item) pairs from a JSON array body, {"items": [...]}, or an NDJSON stream read line by line."""
+    if request.mimetype == 'application/x-ndjson':
+        index = 0
+        for line in request.stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield index, json.loads(line)
+            except ValueError:
+                yield index, None
+            index += 1
+        return
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get('items')
+    if not isinstance(data, list):
+        raise ValueError('JSON array, {"items": [...]} or NDJSON body required')
+    yield from enumerate(data)
+
+def iter_chunks(pairs, size=BULK_CHUNK_SIZE):
+    chunk = []
+    for pair in pairs:
+        chunk.append(pair)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def apply_bulk(validate, apply_chunk):
+    """Validate items and apply them chunk by chunk, one transaction per chunk.
+
+    The write lock is taken per chunk, not per request, so a slow upload does not block other writers
+    while its next chunk is being read. If a chunk violates a constraint it is retried item by item
+    so only the offending items fail. Returns (results, error_message).
+    """
+    results = []
+    try:
+        for chunk in iter_chunks(iter_bulk_items()):
+            valid = []
+            for index, item in chunk:
+                message = validate(item) if isinstance(item, dict) else "Item must be a JSON object"
+                if message:
+                    results.append({"index": index, "success": False, "message": message})
+                else:
+                    valid.append((index, item))
+            if not valid:
+                continue
+            with write_serializer:
+                try:
+                    results.extend(apply_chunk(valid))
+                except IntegrityError:
+                    db.session.rollback()
+                    for pair in valid:
+                        try:
+                            results.extend(apply_chunk([pair]))
+                        except IntegrityError as e:
+                            db.session.rollback()
+                            results.append({"index": pair[0], "success": False, "message": f"Constraint violation: {e.orig}"})
+    except ValueError as e:
+        return results, str(e)
+    results.sort(key=lambda result: result["index"])
+    return results, None
+
+def bulk_response(results, error):
+    if error and not results:
+        return jsonify({"success": False, "message": error}), 400
+    failed = sum(1 for result in results if not result["success"])
+    summary = Counter(result["status"] for result in results if result["success"])
+    return jsonify({
+        "success": failed == 0,
+        "total": len(results),
+        "failed": failed,
+        **summary,
+        "results": results
+    })
+
+def is_text(value):
+    return isinstance(value, str) and bool(value.strip())
+
+def validate_content_item(item):
+    if not item.get('title') or not item.get('content') or not item.get('url'):
+        return "title, content, and url are required"
+    if not all(is_text(item[field]) for field in ('title', 'content', 'url')):
+        return "title, content, and url must be strings"
+    if item.get('category') is not None and not isinstance(item['category'], str):
+        return "category must be a string"
+    return None
+
+def upsert_content_chunk(pairs):
+    # The same (title, url) may only be written once per statement; the last occurrence wins
+    latest = {}
+    for index, item in pairs:
+        latest[(item['title'], item['url'])] = {
+            "title": item['title'], "content": item['content'], "url": item['url'], "category": item.get('category')
+        }
+    keys = list(latest)
+    existing = {
+        (row.title, row.url): row
+        for row in db.session.execute(
+            select(Content.title, Content.url, Content.category).where(tuple_(Content.title, Content.url).in_(keys))
+        )
+    }
+    returned = db.session.execute(upsert_statement(list(latest.values())).returning(Content.id, Content.title, Content.url))
+    ids = {(row.title, row.url): row.id for row in returned}
+    deltas = Counter()
+    for key, row in latest.items():
+        if key in existing:
+            deltas[existing[key].category] -= 1
+        deltas[row['category']] += 1
+    for category, delta in deltas.items():
+        if category and delta:
+            adjust_category_count(category, delta)
+    version = bump_data_version()
+    log_content_changes(version, ids.values())
+    db.session.commit()
+    patch_search_index(version, added=[(ids[key], row['title'], row['content'], row['url']) for key, row in latest.items()])
+    # Only the first occurrence of a new (title, url) creates the row; repeats in the chunk update it
+    results = []
+    seen = set(existing)
+    for index, item in pairs:
+        key = (item['title'], item['url'])
+        results.append({"index": index, "success": True, "status": "updated" if key in seen else "created", "id": ids[key]})
+        seen.add(key)
+    return results
+
+def validate_url_update(item):
+    if not item.get('url'):
+        return "New URL is required"
+    if not is_text(item['url']):
+        return "url must be a string"
+    if not item.get('id') and not item.get('title'):
+        return "Either id or title must be provided"
+    if item.get('id') and (not isinstance(item['id'], int) or isinstance(item['id'], bool)):
+        return "id must be an integer"
+    if not item.get('id') and not is_text(item['title']):
+        return "title must be a string"
+    return None
+
+def update_urls_chunk(pairs):
+    ids = [item['id'] for _, item in pairs if item.get('id')]
+    titles = [item['title'] for _, item in pairs if not item.get('id')]
+    columns = (Content.id, Content.title, Content.content)
+    by_id = {row.id: row for row in db.session.execute(select(*columns).where(Content.id.in_(ids)))} if ids else {}
+    by_title = {}
+    if titles:
+        # Like the single update, a title matches its first (lowest id) row
+        for row in db.session.execute(select(*columns).where(Content.title.in_(titles)).order_by(Content.id)):
+            by_title.setdefault(row.title, row)
+    results = []
+    updates = {}
+    for index, item in pairs:
+        target = by_id.get(item['id']) if item.get('id') else by_title.get(item['title'])
+        if target is None:
+            results.append({"index": index, "success": False, "message": "Content not found"})
+            continue
+        updates[target.id] = (target, item['url'])
+        results.append({"index": index, "success": True, "status": "updated", "id": target.id})
+    if updates:
+        db.session.execute(update(Content), [
+            {"id": content_id, "url": url, "canonical_url": canonicalize_url(url)} for content_id, (_, url) in updates.items()
+        ])
+        version = bump_data_version()
+        log_content_changes(version, updates)
+        db.session.commit()
+        patch_search_index(version, added=[(target.id, target.title, target.content, url) for target, url in updates.values()])
+    return results
+
+@app.route('/content/bulk', methods=['POST'])
+def bulk_upsert_content():
+    results, error = apply_bulk(validate_content_item, upsert_content_chunk)
+    return bulk_response(results, error)
+
+@app.route('/content/bulk/update-url', methods=['PUT'])
+def bulk_update_content_url():
+    results, error = apply_bulk(validate_url_update, update_urls_chunk)
+    return bulk_response(results, error)
+
 @app.route('/content/duplicates')
 def content_duplicates():
-    from sqlalchemy import func
-    duplicates = db.session.query(
-        Content.title,
-        Content.url,
-        func.count(Content.id).label('count')
-    ).group_by(Content.title, Content.url).having(func.count(Content.id) > 1).all()
+    # One windowed query returns every duplicated row; grouping happens in Python
     duplicate_entries = []
-    for title, url, count in duplicates:
-        entries = Content.query.filter_by(title=title, url=url).all()
-        duplicate_entries.append({
-            "title": title,
-            "url": url,
-            "count": count,
-            "entries": [{"id": e.id, "content": e.content} for e in entries]
-        })
+    for row in db.session.execute(duplicate_rows_statement(Content)):
+        if not duplicate_entries or (duplicate_entries[-1]["title"], duplicate_entries[-1]["url"]) != (row.title, row.canonical_url):
+            duplicate_entries.append({
+                "title": row.title,
+                "url": row.canonical_url,
+                "count": row.group_size,
+                "entries": []
+            })
+        duplicate_entries[-1]["entries"].append({"id": row.id, "content": row.content})
     return jsonify({
         "success": True,
         "total_duplicates": len(duplicate_entries),
@@ -393,22 +1279,23 @@ def content_duplicates():
     })
 
 def remove_duplicate_entries():
-    from sqlalchemy import func
-    duplicates = db.session.query(
-        Content.url,
-        func.count(Content.id).label('count')
-    ).group_by(Content.url).having(func.count(Content.id) > 1).all()
-    removed_count = 0
-    for url, count in duplicates:
-        entries = Content.query.filter_by(url=url).order_by(Content.id).all()
-        # Keep the first entry, delete the rest
-        for entry in entries[1:]:
-            db.session.delete(entry)
-            removed_count += 1
-    db.session.commit()
-    return removed_count
+    # Keep the lowest id per (title, canonical URL) and delete the rest in a single statement
+    result = db.session.execute(delete_duplicates_statement(Content), execution_options={"synchronize_session": False})
+    removed = result.all()
+    removed_ids = [row.id for row in removed]
+    for category, count in Counter(row.category for row in removed).items():
+        adjust_category_count(category, -count)
+    if removed_ids:
+        version = bump_data_version()
+        log_content_changes(version, removed_ids)
+        db.session.commit()
+        patch_search_index(version, removed=removed_ids)
+    else:
+        db.session.rollback()
+    return len(removed_ids)
 
 @app.route('/content/remove-duplicates', methods=['DELETE'])
+@write_serializer
 def remove_duplicates():
     removed_count = remove_duplicate_entries()
     return jsonify({
@@ -416,16 +1303,175 @@ def remove_duplicates():
         "message": f"Removed {removed_count} duplicate entries."
     })
 
-db_initialized = False
+LINK_STATUS_COLUMNS = (
+    Content.id, Content.title, Content.url, LinkStatus.status_code, LinkStatus.final_url,
+    LinkStatus.latency_ms, LinkStatus.error, LinkStatus.checked_at
+)
 
-@app.before_request
-def initialize_database():
-    global db_initialized
-    if not db_initialized:
-        init_db()
-        remove_duplicate_entries()
-        db_initialized = True
+link_checks_total = metrics.counter('easytoget_link_checks_total', 'URLs checked by the link checker', ('result',))
+# Only one link check runs per process; link_check_job tracks its progress for /links/status
+link_check_lock = threading.Lock()
+link_check_job = {"running": False, "started_at": None, "finished_at": None, "urls": 0, "checked": 0, "broken": 0, "error": None}
+
+def make_link_checker():
+    return LinkChecker(
+        max_workers=app.config['LINK_CHECK_WORKERS'],
+        per_host=app.config['LINK_CHECK_PER_HOST'],
+        timeout=app.config['LINK_CHECK_TIMEOUT'],
+        retries=app.config['LINK_CHECK_RETRIES']
+    )
+
+def save_link_results(rows):
+    stmt = dialect_insert(LinkStatus).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['content_id'],
+        set_={name: stmt.excluded[name] for name in rows[0] if name != 'content_id'}
+    )
+    with write_serializer:
+        db.session.execute(stmt)
+        db.session.commit()
+
+def run_link_check(ids=None, checker=None):
+    """Check the URLs of the given rows (default: the whole catalog) and store one result per row.
+
+    Each distinct URL is requested once. Results are saved in chunks as they arrive; the data
+    version is bumped once at the end so cached link_status listings are refreshed.
+    """
+    stmt = select(Content.id, Content.url)
+    if ids is not None:
+        stmt = stmt.where(Content.id.in_(ids))
+    rows_by_url = {}
+    for content_id, url in db.session.execute(stmt).all():
+        rows_by_url.setdefault(url, []).append(content_id)
+    # End the read transaction so a long check does not pin an old WAL snapshot
+    db.session.rollback()
+    link_check_job.update(running=True, started_at=datetime.utcnow(), finished_at=None, urls=len(rows_by_url), checked=0, broken=0, error=None)
+    checker = checker or make_link_checker()
+    pending = []
+    try:
+        for url, result in checker.check_all((url, url) for url in rows_by_url):
+            link_check_job["checked"] += 1
+            if not result.ok:
+                link_check_job["broken"] += 1
+            link_checks_total.inc(('ok' if result.ok else 'broken',))
+            for content_id in rows_by_url[url]:
+                pending.append({
+                    "content_id": content_id, "url": url, "ok": result.ok, "status_code": result.status_code,
+                    "final_url": result.final_url[:2048], "latency_ms": result.latency_ms,
+                    "error": result.error[:255] if result.error else None, "checked_at": result.checked_at
+                })
+            if len(pending) >= BULK_CHUNK_SIZE:
+                save_link_results(pending)
+                pending = []
+        if pending:
+            save_link_results(pending)
+        if rows_by_url:
+            with write_serializer:
+                version = bump_data_version()
+                db.session.commit()
+            patch_search_index(version)
+    except Exception as e:
+        db.session.rollback()
+        link_check_job["error"] = str(e)
+        logger.exception("Link check failed")
+    finally:
+        link_check_job.update(running=False, finished_at=datetime.utcnow())
+    logger.info(f"Link check finished: {link_check_job['checked']} URLs checked, {link_check_job['broken']} broken")
+    return dict(link_check_job)
+
+def start_link_check(ids=None, wait=False):
+    """Run a link check on a background thread, or inline when wait is set; False if one is already running."""
+    if not link_check_lock.acquire(blocking=False):
+        return False
+
+    def job():
+        try:
+            with app.app_context():
+                run_link_check(ids)
+        finally:
+            link_check_lock.release()
+
+    if wait:
+        job()
+    else:
+        threading.Thread(target=job, name='link-check', daemon=True).start()
+    return True
+
+@app.route('/links/check', methods=['POST'])
+def check_links():
+    # No body checks the whole catalog; {"ids": []} checks nothing
+    data = {}
+    if request.get_data():
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"success": False, "message": "Body must be a JSON object"}), 400
+    ids = data.get('ids')
+    if ids is not None and (not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids)):
+        return jsonify({"success": False, "message": "ids must be a list of content ids"}), 400
+    wait = arg_flag('wait', default=False)
+    if not start_link_check(ids, wait=wait):
+        return json_response({"success": False, "message": "A link check is already running", "job": link_check_job}, 409)
+    if wait:
+        return json_response({"success": link_check_job["error"] is None, "message": "Link check finished", "job": link_check_job})
+    return json_response({"success": True, "message": "Link check started", "job": link_check_job}, 202)
+
+@app.route('/links/status')
+def links_status():
+    state = request.args.get('state')
+    if state and state not in LINK_STATES:
+        return jsonify({"success": False, "message": 'state must be one of "ok", "broken" or "unchecked"'}), 400
+    checked = and_(LinkStatus.content_id == Content.id, LinkStatus.url == Content.url)
+    total, checked_count, broken, last_checked = db.session.execute(
+        select(func.count(Content.id), func.count(LinkStatus.content_id),
+               func.count(case((LinkStatus.ok.is_(False), 1))), func.max(LinkStatus.checked_at))
+        .select_from(Content).outerjoin(LinkStatus, checked)
+    ).one()
+    payload = {
+        "success": True,
+        "summary": {
+            "total": total,
+            "ok": checked_count - broken,
+            "broken": broken,
+            "unchecked": total - checked_count,
+            "last_checked_at": last_checked
+        },
+        "job": link_check_job
+    }
+    if state:
+        per_page = request.args.get('per_page', default=50, type=int)
+        if state == 'unchecked':
+            result = keyset_paginate(LIST_COLUMNS, (link_state_clause(state),), "/links/status", per_page)
+        else:
+            result = keyset_paginate(LINK_STATUS_COLUMNS, (checked, LinkStatus.ok == (state == 'ok')), "/links/status", per_page)
+        if result is None:
+            return invalid_cursor_response()
+        data = result.pop('items')
+        payload.update(state=state, **result, data=data)
+    return json_response(payload)
+
+def bootstrap_db(force=False):
+    """Seed and dedupe the database once per deployment rather than in every worker's first request."""
+    with write_serializer:
+        seeded = init_db(force=force)
+        removed = remove_duplicate_entries()
+        # Re-derive the summary once per deployment so any drift is corrected
+        rebuild_category_counts()
+        db.session.commit()
+    logger.info(f"Bootstrap finished: seed {'applied' if seeded else 'unchanged'}, {removed} duplicates removed")
+
+@app.cli.command('bootstrap')
+@click.option('--force', is_flag=True, help='Re-apply the seed data even if its fingerprint is unchanged.')
+def bootstrap_command(force):
+    bootstrap_db(force=force)
+
+@app.cli.command('check-links')
+def check_links_command():
+    # Runs in the foreground, e.g. from cron, independently of any web worker
+    job = run_link_check()
+    click.echo(f"{job['checked']} URLs checked, {job['broken']} broken")
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))  # Changed default port to 5001 to avoid conflict
+    with app.app_context():
+        bootstrap_db()
     app.run(port=port, debug=True)
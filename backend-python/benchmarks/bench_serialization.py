@@ -0,0 +1,52 @@
+"""Micro-benchmark: ORM hydration + jsonify vs column projection + fast JSON for listing rows.
+
+Usage: python backend-python/benchmarks/bench_serialization.py [--rows 20000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from dataset import build_dataset, load_backend
+
+
+def orm_path(backend):
+    contents = backend.Content.query.all()
+    data = [{"id": c.id, "title": c.title, "content": c.content, "url": c.url, "category": c.category} for c in contents]
+    return backend.app.json.dumps({"success": True, "total": len(data), "data": data}).encode()
+
+
+def projection_path(backend):
+    data = backend.fetch_dicts(backend.select(*backend.EXPORT_COLUMNS).order_by(backend.Content.id))
+    return backend.dumps({"success": True, "total": len(data), "data": data})
+
+
+def best_of(fn, backend, repeat):
+    timings = []
+    for _ in range(repeat):
+        with backend.app.app_context():
+            start = time.perf_counter()
+            fn(backend)
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    backend = load_backend(os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    build_dataset(backend, args.rows)
+    import serialization
+    results = {"rows": args.rows, "encoder": "orjson" if serialization.orjson else "json"}
+    for name, fn in (("orm_jsonify", orm_path), ("projection_fast_json", projection_path)):
+        seconds = best_of(fn, backend, args.repeat)
+        results[name] = {"seconds": round(seconds, 6), "us_per_row": round(seconds / args.rows * 1e6, 3)}
+    results["speedup"] = round(results["orm_jsonify"]["seconds"] / results["projection_fast_json"]["seconds"], 2)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Synthetic Content tables shaped like the seed data in app.INITIAL_DATA."""
+import os
+import sqlite3
+import sys
+from urllib.parse import urlsplit, urlunsplit
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INSERT_BATCH_SIZE = 5000
+BENCHMARK_ROWS_KEY = 'benchmark_rows'
+
+
+def load_backend(db_file, response_cache=True):
+    """Import the Flask app bound to db_file. Must run before anything else imports app."""
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.abspath(db_file)
+    if not response_cache:
+        os.environ['RESPONSE_CACHE_MAX_ENTRIES'] = '0'
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+    import app as backend
+    return backend
+
+
+def variant_url(url, i):
+    # The suffix goes into the query, ahead of any #fragment, so every synthetic URL stays distinct after canonicalization
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(query=f"{parts.query}&v={i}" if parts.query else f"v={i}"))
+
+
+def copy_database(source, target):
+    """Copy a SQLite database, including committed pages still in its WAL, to a fresh target file."""
+    remove_database(target)
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(target)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+
+
+def remove_database(path):
+    for suffix in ('', '-wal', '-shm', '.write-lock'):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def synthetic_rows(backend, rows):
+    template = backend.INITIAL_DATA
+    now = backend.datetime.utcnow()
+    for i in range(rows):
+        seed = template[i % len(template)]
+        url = variant_url(seed['url'], i)
+        yield {
+            "title": f"{seed['title']} {i}",
+            "content": seed['content'],
+            "url": url,
+            "canonical_url": backend.canonicalize_url(url),
+            "category": seed['category'],
+            "category_key": backend.normalize_category(seed['category']),
+            "created_at": now
+        }
+
+
+def build_dataset(backend, rows):
+    """Bootstrap the database and add `rows` synthetic rows; a database that already has them is reused."""
+    with backend.app.app_context():
+        backend.bootstrap_db()
+        state = backend.db.session.get(backend.AppState, BENCHMARK_ROWS_KEY)
+        if state is not None:
+            if state.value != rows:
+                raise SystemExit(f"{backend.db.engine.url.database} holds a {state.value}-row dataset; use a fresh --data-dir")
+            return False
+        batch = []
+        for row in synthetic_rows(backend, rows):
+            batch.append(row)
+            if len(batch) == INSERT_BATCH_SIZE:
+                backend.db.session.execute(backend.insert(backend.Content), batch)
+                batch = []
+        if batch:
+            backend.db.session.execute(backend.insert(backend.Content), batch)
+        backend.db.session.add(backend.AppState(key=BENCHMARK_ROWS_KEY, value=rows))
+        backend.rebuild_category_counts()
+        version = backend.bump_data_version()
+        backend.log_content_changes(version, None)
+        backend.db.session.commit()
+        return True
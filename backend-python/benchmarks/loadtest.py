@@ -0,0 +1,301 @@
+"""Reproducible benchmark and load test for the Flask backend.
+
+Run a suite in-process (Flask test client) or against a local gunicorn:
+
+    python backend-python/benchmarks/loadtest.py run --rows 1000 --output base.json
+    python backend-python/benchmarks/loadtest.py run --rows 100000 --mode gunicorn --workers 4 --concurrency 16
+    python backend-python/benchmarks/loadtest.py compare base.json new.json --threshold 10
+
+Datasets are cached per size in --data-dir. Each run works on a fresh copy of the cached
+table, so the write and dedupe scenarios never change what the next run measures.
+"""
+import argparse
+import datetime
+import http.client
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dataset import BACKEND_DIR, build_dataset, copy_database, load_backend, remove_database
+
+REPO_DIR = os.path.dirname(BACKEND_DIR)
+
+
+def scenarios(backend):
+    """(name, method, path(i), body(i)) tuples; write scenarios come last since they change the data."""
+    category = backend.INITIAL_DATA[0]['category'].replace(' ', '-').lower()
+
+    def get(path):
+        return lambda i: path
+
+    return [
+        ("content_page_1", "GET", get("/content"), None),
+        ("content_deep_page", "GET", get("/content?page=500&with_total=0"), None),
+        ("content_all", "GET", get("/content/all"), None),
+        ("content_all_ndjson", "GET", get("/content/all?format=ndjson"), None),
+        ("category_page", "GET", get(f"/content/category/{category}"), None),
+        ("categories", "GET", get("/categories"), None),
+        ("search_short", "GET", get("/search?q=li"), None),
+        ("search_long", "GET", get("/search?q=official%20download%20link"), None),
+        ("search_zero_hit", "GET", get("/search?q=zzqxjv"), None),
+        # Cache-busted variant: distinct query per request, like Home.js's debounced keystrokes
+        ("search_uncached", "GET", lambda i: f"/search?q=linux%20{i % 1000}", None),
+        ("duplicates_report", "GET", get("/content/duplicates"), None),
+        ("add_content", "POST", lambda i: "/content/category/Benchmark",
+         lambda i: {"title": f"Bench {time.time_ns()} {i}", "content": "benchmark row", "url": f"https://bench.example/{i}"}),
+        ("update_url", "PUT", get("/content/update-url"),
+         lambda i: {"id": 1 + i % 50, "url": f"https://bench.example/updated/{i}"}),
+        ("remove_duplicates", "DELETE", get("/content/remove-duplicates"), None),
+    ]
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, elapsed):
+    latencies.sort()
+    to_ms = lambda seconds: None if seconds is None else round(seconds * 1000, 3)
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "mean_ms": to_ms(sum(latencies) / len(latencies)) if latencies else None,
+        "p50_ms": to_ms(percentile(latencies, 0.50)),
+        "p95_ms": to_ms(percentile(latencies, 0.95)),
+        "p99_ms": to_ms(percentile(latencies, 0.99)),
+    }
+
+
+class InProcessClient:
+    def __init__(self, backend):
+        self.app = backend.app
+        self._local = threading.local()
+
+    def request(self, method, path, body):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method, json=body)
+        response.get_data()
+        return response.status_code
+
+
+class HTTPClient:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+
+    def request(self, method, path, body):
+        # gunicorn's sync workers close the connection after each response
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        try:
+            headers = {}
+            payload = None
+            if body is not None:
+                payload = json.dumps(body)
+                headers['Content-Type'] = 'application/json'
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+
+def run_scenario(client, method, path_for, body_for, requests, concurrency):
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one(i):
+        nonlocal errors
+        path = path_for(i)
+        body = body_for(i) if body_for else None
+        start = time.perf_counter()
+        try:
+            status = client.request(method, path, body)
+        except Exception:
+            status = None
+        elapsed = time.perf_counter() - start
+        with lock:
+            if status is not None and status < 400:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(db_file, workers, env_overrides):
+    port = free_port()
+    env = dict(os.environ, DATABASE_URL='sqlite:///' + os.path.abspath(db_file), **env_overrides)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', os.path.join(BACKEND_DIR, 'gunicorn.conf.py'),
+         'backend-python.app:app', '--bind', f'127.0.0.1:{port}', '--workers', str(workers)],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    client = HTTPClient('127.0.0.1', port)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit("gunicorn exited during startup")
+        try:
+            if client.request('GET', '/health', None) == 200:
+                return process, client
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit("gunicorn did not become healthy within 60s")
+
+
+def run(args):
+    os.makedirs(args.data_dir, exist_ok=True)
+    cached_file = os.path.join(args.data_dir, f'bench-{args.rows}.db')
+    db_file = os.path.join(args.data_dir, f'bench-{args.rows}.run.db')
+    if os.path.exists(cached_file):
+        copy_database(cached_file, db_file)
+    else:
+        remove_database(db_file)
+    backend = load_backend(db_file, response_cache=not args.no_cache)
+    build_started = time.perf_counter()
+    built = build_dataset(backend, args.rows)
+    build_seconds = time.perf_counter() - build_started
+    if built:
+        # Keep the pristine dataset before any scenario writes to the run copy
+        copy_database(db_file, cached_file)
+
+    process = None
+    if args.mode == 'gunicorn':
+        env_overrides = {'RESPONSE_CACHE_MAX_ENTRIES': '0'} if args.no_cache else {}
+        process, client = start_gunicorn(db_file, args.workers, env_overrides)
+    else:
+        client = InProcessClient(backend)
+
+    selected = set(args.scenario or [])
+    results = {}
+    try:
+        for name, method, path_for, body_for in scenarios(backend):
+            if selected and name not in selected:
+                continue
+            if args.read_only and method != 'GET':
+                continue
+            requests = max(1, args.requests // 10) if name in ('content_all', 'content_all_ndjson') and args.rows > 10000 else args.requests
+            for i in range(args.warmup):
+                client.request(method, path_for(-1 - i), body_for(-1 - i) if body_for else None)
+            results[name] = run_scenario(client, method, path_for, body_for, requests, args.concurrency)
+            print(f"{name:22} {results[name]['throughput_rps']:>10} rps  p50 {results[name]['p50_ms']} ms  "
+                  f"p95 {results[name]['p95_ms']} ms  p99 {results[name]['p99_ms']} ms", file=sys.stderr)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+        with backend.app.app_context():
+            backend.db.engine.dispose()
+        remove_database(db_file)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "mode": args.mode,
+            "workers": args.workers if args.mode == 'gunicorn' else None,
+            "rows": args.rows,
+            "dataset_built": built,
+            "dataset_build_seconds": round(build_seconds, 3),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "response_cache": not args.no_cache,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+def compare(args):
+    """Print per-scenario changes from base to new; exit 1 if any exceeds the regression threshold."""
+    with open(args.base) as f:
+        base = json.load(f)['results']
+    with open(args.new) as f:
+        new = json.load(f)['results']
+    change = lambda old, value: None if not old or value is None else round((value - old) / old * 100, 1)
+    comparison = {}
+    regressions = []
+    for name in sorted(set(base) & set(new)):
+        entry = {
+            "throughput_rps_change_pct": change(base[name]['throughput_rps'], new[name]['throughput_rps']),
+            "p50_ms_change_pct": change(base[name]['p50_ms'], new[name]['p50_ms']),
+            "p95_ms_change_pct": change(base[name]['p95_ms'], new[name]['p95_ms']),
+            "p99_ms_change_pct": change(base[name]['p99_ms'], new[name]['p99_ms']),
+        }
+        comparison[name] = entry
+        p95 = entry['p95_ms_change_pct']
+        throughput = entry['throughput_rps_change_pct']
+        if (p95 is not None and p95 > args.threshold) or (throughput is not None and throughput < -args.threshold):
+            regressions.append(name)
+    print(json.dumps({
+        "base": args.base,
+        "new": args.new,
+        "threshold_pct": args.threshold,
+        "only_in_base": sorted(set(base) - set(new)),
+        "only_in_new": sorted(set(new) - set(base)),
+        "regressions": regressions,
+        "scenarios": comparison,
+    }, indent=2))
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EasyToGet backend benchmark suite")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmark scenarios and write a JSON report')
+    run_parser.add_argument('--rows', type=int, default=1000, help='Synthetic table size, e.g. 1000, 100000 or 1000000')
+    run_parser.add_argument('--mode', choices=('inprocess', 'gunicorn'), default='inprocess')
+    run_parser.add_argument('--workers', type=int, default=4, help='gunicorn workers (gunicorn mode)')
+    run_parser.add_argument('--requests', type=int, default=200, help='Requests per scenario')
+    run_parser.add_argument('--concurrency', type=int, default=4)
+    run_parser.add_argument('--warmup', type=int, default=5, help='Untimed requests per scenario')
+    run_parser.add_argument('--scenario', action='append', help='Only run the named scenario (repeatable)')
+    run_parser.add_argument('--read-only', action='store_true', help='Skip the write and dedupe scenarios')
+    run_parser.add_argument('--no-cache', action='store_true', help='Disable the response cache')
+    run_parser.add_argument('--data-dir', default=os.path.join(BACKEND_DIR, '.bench-data'))
+    run_parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+
+    compare_parser = commands.add_parser('compare', help='Compare two JSON reports')
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+
+    args = parser.parse_args()
+    if args.command == 'compare':
+        sys.exit(compare(args))
+    run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+import zlib
+
+
+def gzip_stream(chunks, level=6):
+    """gzip a streamed body chunk by chunk.
+
+    Each chunk is sync-flushed so the client can decode rows as they arrive instead
+    of waiting for the whole stream. The source iterable is closed when the stream ends.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
@@ -0,0 +1,45 @@
+from urllib.parse import urlsplit, urlunsplit
+
+from sqlalchemy import and_, delete, exists, func, select
+from sqlalchemy.orm import aliased
+
+
+def canonicalize_url(url):
+    """Normalize a URL for duplicate detection.
+
+    Lowercases the scheme and host, treats http and https as the same,
+    drops the fragment and any trailing slash. The query string is kept
+    since it often selects the download (e.g. Play Store ids).
+    """
+    if not url:
+        return url
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme == 'http':
+        scheme = 'https'
+    path = parts.path.rstrip('/')
+    return urlunsplit((scheme, parts.netloc.lower(), path, parts.query, ''))
+
+
+def duplicate_rows_statement(model):
+    """Select every row that shares (title, canonical_url) with another, with its group size, in one query."""
+    group_size = func.count(model.id).over(partition_by=(model.title, model.canonical_url)).label('group_size')
+    ranked = select(model.id, model.title, model.canonical_url, model.content, group_size).subquery()
+    return (
+        select(ranked)
+        .where(ranked.c.group_size > 1)
+        .order_by(ranked.c.title, ranked.c.canonical_url, ranked.c.id)
+    )
+
+
+def delete_duplicates_statement(model):
+    """Delete every row that shares (title, canonical_url) with a row of lower id, returning the deleted ids and categories.
+
+    Uses the same grouping as duplicate_rows_statement, so it removes exactly the
+    rows past the first in each group that /content/duplicates reports.
+    """
+    older = aliased(model)
+    has_older = exists().where(and_(
+        older.title == model.title, older.canonical_url == model.canonical_url, older.id < model.id
+    ))
+    return delete(model).where(has_older).returning(model.id, model.category)
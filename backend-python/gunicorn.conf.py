@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+# Loaded with `gunicorn -c backend-python/gunicorn.conf.py backend-python.app:app`
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# A /search that reaches a worker before its search index is built waits for the build,
+# which takes tens of seconds on a catalog of a few hundred thousand rows
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+
+
+def on_starting(server):
+    # Runs once in the master before any worker forks, so seeding and dedupe are paid once per deployment.
+    # The bootstrap runs in a child process: importing the app here would leave a second copy of it
+    # (engine, asset cache, indexes, metrics) in every forked worker.
+    subprocess.run(
+        [sys.executable, '-m', 'flask', '--app', os.path.join(BACKEND_DIR, 'app.py'), 'bootstrap'],
+        check=True  # app.py anchors a relative sqlite:/// DATABASE_URL at backend-python/, so this is the workers' file
+    )
+
+
+def post_worker_init(worker):
+    # Start building the search index in the background as soon as the worker is up, rather than inside
+    # its first /search. A failure here would stop the worker from booting, so it is only logged.
+    try:
+        sys.modules[worker.wsgi.import_name].warm_search_index()
+    except Exception:
+        worker.log.exception("Search index warm-up failed")
@@ -0,0 +1,188 @@
+import http.client
+import ipaddress
+import itertools
+import socket
+import ssl
+import threading
+import time
+from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from urllib.parse import urljoin, urlsplit
+
+CheckResult = namedtuple('CheckResult', ['status_code', 'ok', 'final_url', 'latency_ms', 'error', 'checked_at'])
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+RETRY_CODES = (429, 500, 502, 503, 504)
+# Some servers reject HEAD outright; those URLs are retried with GET
+HEAD_UNSUPPORTED_CODES = (403, 405, 501)
+MAX_GET_BODY = 64 * 1024
+
+
+class BlockedAddressError(ValueError):
+    """The URL's host resolves to a private, loopback, link-local or otherwise non-public address."""
+
+
+def is_public_address(ip):
+    address = ipaddress.ip_address(ip)
+    if address.version == 6 and address.ipv4_mapped:
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
+
+
+class LinkChecker:
+    """Checks many URLs concurrently on a thread pool.
+
+    Each thread keeps one persistent connection per host, a semaphore caps the
+    in-flight requests per host, and connection errors, 429 and 5xx are retried
+    with exponential backoff (honouring a short Retry-After).
+
+    Catalog URLs are user supplied, so hosts resolving to non-public addresses are
+    refused at connect time unless allow_private is set (e.g. for a local stub server).
+    """
+
+    def __init__(self, max_workers=32, per_host=4, timeout=10.0, retries=2, backoff=0.5,
+                 max_redirects=5, user_agent='EasyToGet-LinkChecker/1.0', ssl_context=None, allow_private=False):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_redirects = max_redirects
+        self.user_agent = user_agent
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.allow_private = allow_private
+        self._host_slots = defaultdict(lambda: threading.BoundedSemaphore(self.per_host))
+        self._host_slots_lock = threading.Lock()
+        self._local = threading.local()
+
+    def check_all(self, items):
+        """Check (key, url) pairs; yields (key, CheckResult) as each one completes."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self.check, url): key for key, url in interleave_by_host(items)}
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def check(self, url):
+        started = time.perf_counter()
+        current = url
+        status = None
+        error = None
+        try:
+            for _ in range(self.max_redirects + 1):
+                status, location = self._request_with_retries(current)
+                if status in REDIRECT_CODES and location:
+                    current = urljoin(current, location)
+                    continue
+                break
+            else:
+                error = 'Too many redirects'
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            error = f'{type(e).__name__}: {e}'
+        latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        ok = error is None and status is not None and status < 400
+        return CheckResult(status, ok, current, latency_ms, error, datetime.utcnow())
+
+    def _request_with_retries(self, url):
+        for attempt in range(self.retries + 1):
+            try:
+                status, location, retry_after = self._request(url, 'HEAD')
+                if status in HEAD_UNSUPPORTED_CODES:
+                    status, location, retry_after = self._request(url, 'GET')
+            except (OSError, http.client.HTTPException):
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+                continue
+            if status in RETRY_CODES and attempt < self.retries:
+                time.sleep(min(retry_after or self.backoff * 2 ** attempt, 10))
+                continue
+            return status, location
+        return status, location
+
+    def _slot(self, host):
+        with self._host_slots_lock:
+            return self._host_slots[host]
+
+    def _request(self, url, method):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f'Unsupported URL: {url}')
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        key = (parts.scheme, parts.netloc.lower())
+        with self._slot(key[1]):
+            connection = self._connection(key, parts)
+            try:
+                connection.request(method, path, headers={'User-Agent': self.user_agent, 'Accept': '*/*'})
+                response = connection.getresponse()
+                if method == 'GET':
+                    response.read(MAX_GET_BODY)
+                    if not response.isclosed():
+                        # Body larger than we care about: drop the connection rather than drain it
+                        self._drop(key)
+                else:
+                    response.read()
+                if response.will_close:
+                    self._drop(key)
+            except (OSError, http.client.HTTPException, ValueError):
+                self._drop(key)
+                raise
+        retry_after = response.getheader('Retry-After')
+        return response.status, response.getheader('Location'), float(retry_after) if retry_after and retry_after.isdigit() else None
+
+    def _connections(self):
+        connections = getattr(self._local, 'connections', None)
+        if connections is None:
+            connections = self._local.connections = {}
+        return connections
+
+    def _connection(self, key, parts):
+        connections = self._connections()
+        connection = connections.get(key)
+        if connection is None:
+            if parts.scheme == 'https':
+                connection = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=self.timeout, context=self.ssl_context)
+            else:
+                connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self.timeout)
+            # http.client opens its socket through this hook; HTTPS then wraps it with the original hostname for SNI
+            connection._create_connection = self._open_socket
+            connections[key] = connection
+        return connection
+
+    def _open_socket(self, address, timeout=None, source_address=None):
+        # Resolve once and connect to the vetted addresses, so a second DNS answer cannot swap in a private one
+        host, port = address
+        addresses = [info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)]
+        if not self.allow_private:
+            for ip in addresses:
+                if not is_public_address(ip):
+                    raise BlockedAddressError(f'{host} resolves to non-public address {ip}')
+        error = OSError(f'No addresses for {host}')
+        for ip in addresses:
+            try:
+                return socket.create_connection((ip, port), timeout, source_address)
+            except OSError as e:
+                error = e
+        raise error
+
+    def _drop(self, key):
+        connection = self._connections().pop(key, None)
+        if connection is not None:
+            connection.close()
+
+
+def interleave_by_host(items):
+    """Order (key, url) pairs round-robin across hosts so one large host does not hold every worker."""
+    by_host = OrderedDict()
+    for key, url in items:
+        by_host.setdefault(urlsplit(url).netloc.lower(), []).append((key, url))
+    for group in itertools.zip_longest(*by_host.values()):
+        for item in group:
+            if item is not None:
+                yield item
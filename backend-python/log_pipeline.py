@@ -0,0 +1,138 @@
+import atexit
+import copy
+import datetime
+import json
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler
+
+_STOP = object()
+
+
+class JSONLineFormatter(logging.Formatter):
+    """One JSON object per record; structured fields passed as extra={"fields": {...}} are merged in."""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the writer thread.
+
+    The stdlib prepare() formats the whole record on the logging thread and
+    folds the traceback into the message. Here only the message is merged with
+    its args; exc_info stays on the record for JSONLineFormatter to render.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BatchLogWriter(threading.Thread):
+    """Drains the log queue on a background thread and writes records in batches.
+
+    Request threads only pay for a queue put; formatting and stream I/O happen
+    here, one write per batch or per flush interval, whichever comes first.
+    """
+
+    def __init__(self, log_queue, stream, formatter, batch_size=100, flush_interval=0.5):
+        super().__init__(name='log-writer', daemon=True)
+        self.queue = log_queue
+        self.stream = stream
+        self.formatter = formatter
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+    def run(self):
+        while True:
+            batch = []
+            stop = False
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+                while True:
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            if batch:
+                self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch):
+        lines = []
+        for record in batch:
+            try:
+                lines.append(self.formatter.format(record) + '\n')
+            except Exception:
+                lines.append(json.dumps({"level": "ERROR", "message": "Unformattable log record"}) + '\n')
+        try:
+            self.stream.write(''.join(lines))
+            self.stream.flush()
+        except (OSError, ValueError):
+            pass
+
+    def stop(self):
+        self.queue.put(_STOP)
+        self.join(timeout=5)
+
+
+_writer = None
+
+
+def configure_logging(level=logging.INFO, batch_size=100, flush_interval=0.5, stream=None):
+    """Route all root-logger output through a queue to a background batch writer emitting JSON lines.
+
+    Safe to call again, e.g. in a forked worker whose parent's writer thread did not survive the fork.
+    """
+    global _writer
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(level)
+    _writer = BatchLogWriter(log_queue, stream or sys.stderr, JSONLineFormatter(), batch_size, flush_interval)
+    _writer.start()
+    return _writer
+
+
+@atexit.register
+def _flush_on_exit():
+    if _writer is not None and _writer.is_alive():
+        _writer.stop()
+
+
+def parse_sample_rates(spec):
+    """Parse "rule=rate,rule=rate" (e.g. "/search=0.1,/content=0.5") into a dict."""
+    rates = {}
+    for part in (spec or '').split(','):
+        if '=' in part:
+            rule, rate = part.rsplit('=', 1)
+            rates[rule.strip()] = min(max(float(rate), 0.0), 1.0)
+    return rates
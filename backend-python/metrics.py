@@ -0,0 +1,126 @@
+import bisect
+import threading
+from collections import defaultdict
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100, 250)
+
+
+def format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] += amount
+
+    def render(self, const_labels=()):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{format_labels(self.label_names, labels, const_labels)} {format_value(value)}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text, label_names=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Per-bucket counts plus a trailing +Inf slot, then sum and count
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect.bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self, const_labels=()):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for labels, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + ('+Inf',), counts):
+                    cumulative += bucket_count
+                    le = bound if bound == '+Inf' else format_value(float(bound))
+                    lines.append(f'{self.name}_bucket{format_labels(self.label_names, labels, const_labels + (("le", le),))} {cumulative}')
+                lines.append(f'{self.name}_sum{format_labels(self.label_names, labels, const_labels)} {format_value(total)}')
+                lines.append(f'{self.name}_count{format_labels(self.label_names, labels, const_labels)} {count}')
+        return lines
+
+
+class CallbackMetric:
+    """A gauge or counter whose value is read at scrape time from a callback."""
+
+    def __init__(self, name, help_text, callback, metric_type='gauge'):
+        self.name = name
+        self.help_text = help_text
+        self.callback = callback
+        self.metric_type = metric_type
+
+    def render(self, const_labels=()):
+        return [
+            f'# HELP {self.name} {self.help_text}',
+            f'# TYPE {self.name} {self.metric_type}',
+            f'{self.name}{format_labels((), (), const_labels)} {format_value(self.callback())}'
+        ]
+
+
+class MetricsRegistry:
+    """Process-local metrics rendered in the Prometheus text exposition format.
+
+    Each gunicorn worker keeps its own registry, so a scrape reflects the worker
+    that served it; label series are bounded by route rules, not raw paths.
+    const_labels is called at render time and its (name, value) pairs are added
+    to every series, e.g. the worker pid so each worker's counters stay separate
+    series rather than appearing to reset whenever a scrape lands on another worker.
+    """
+
+    def __init__(self, const_labels=None):
+        self._metrics = []
+        self.const_labels = const_labels
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_text, label_names=()):
+        return self.register(Counter(name, help_text, label_names))
+
+    def histogram(self, name, help_text, label_names=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, help_text, label_names, buckets))
+
+    def gauge(self, name, help_text, callback):
+        return self.register(CallbackMetric(name, help_text, callback))
+
+    def callback_counter(self, name, help_text, callback):
+        return self.register(CallbackMetric(name, help_text, callback, metric_type='counter'))
+
+    def render(self):
+        const_labels = tuple(self.const_labels()) if self.const_labels else ()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render(const_labels))
+        return '\n'.join(lines) + '\n'
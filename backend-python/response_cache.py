@@ -0,0 +1,82 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+# gzip_body is filled in the first time a client that accepts gzip is served the entry
+CachedResponse = namedtuple('CachedResponse', ['body', 'mimetype', 'etag', 'gzip_body'], defaults=(None,))
+
+
+def make_key(path, args, names):
+    # Only the args the view reads are part of the key, so unrelated ones (Home.js's _=Date.now()) share an entry
+    items = sorted((name, value) for name in names for value in args.getlist(name))
+    return (path, tuple(items))
+
+
+def make_etag(body):
+    return hashlib.sha1(body).hexdigest()
+
+
+def entry_size(entry):
+    return len(entry.body) + len(entry.gzip_body or b'')
+
+
+class ResponseCache:
+    """LRU + TTL cache of rendered response bodies, tagged with the data version they were built from.
+
+    An entry is only served while its version equals the current data version,
+    so bumping the version invalidates every entry at once. The cache is bounded
+    both by entry count and by the total size of the bodies it holds; entries
+    larger than max_entry_bytes are not stored.
+    """
+
+    def __init__(self, max_entries=256, ttl=300, max_bytes=64 * 1024 * 1024, max_entry_bytes=4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, version):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                entry_version, expires, entry = item
+                if entry_version == version and expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                self._discard(key)
+            self.misses += 1
+            return None
+
+    def cacheable(self, size):
+        return self.max_entries > 0 and size <= min(self.max_entry_bytes, self.max_bytes)
+
+    def set(self, key, version, entry):
+        size = entry_size(entry)
+        with self._lock:
+            self._discard(key)
+            if not self.cacheable(size):
+                return
+            self._entries[key] = (version, time.monotonic() + self.ttl, entry)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key):
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self.bytes -= entry_size(item[2])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
@@ -0,0 +1,302 @@
+import bisect
+import itertools
+import re
+import threading
+from collections import OrderedDict, defaultdict
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Relevance weight of a match in each indexed column
+FIELD_WEIGHTS = {"title": 3.0, "url": 1.5, "content": 1.0}
+FIELDS = ("title", "content", "url")
+# Queries shorter than a trigram match word prefixes through the sorted token list instead of scanning every document
+SHORT_QUERY_LENGTH = 3
+RESULT_CACHE_SIZE = 256
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def rank(scores):
+    """Turn {id: score} into sorted (-score, id) keys.
+
+    Scores take few distinct values, so ids are sorted within each score
+    instead of sorting every (score, id) pair.
+    """
+    by_score = defaultdict(list)
+    for doc_id, score in scores.items():
+        by_score[score].append(doc_id)
+    results = []
+    for score in sorted(by_score, reverse=True):
+        ids = by_score[score]
+        ids.sort()
+        results.extend(zip(itertools.repeat(-score), ids))
+    return results
+
+
+class SearchIndex:
+    """In-memory token and trigram inverted index over title/content/url.
+
+    Matching keeps the semantics of the old ILIKE '%q%' filter (case-insensitive
+    substring on any of the three columns); the trigram postings narrow the
+    candidates and the token postings feed the relevance score. One- and
+    two-character queries match word prefixes instead, read from the token
+    postings without touching the documents. Ranked results are memoized until
+    the next change to the index.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs = {}
+        self._tokens = defaultdict(dict)
+        self._trigrams = defaultdict(set)
+        self._sorted_tokens = []
+        self._results = OrderedDict()
+        self.ready = False
+        self.version = None
+
+    def __len__(self):
+        return len(self._docs)
+
+    def build(self, rows, version=None):
+        # Index into a fresh instance without holding the lock, so searches keep using the old data meanwhile
+        fresh = SearchIndex()
+        for row in rows:
+            fresh._add(*row)
+        fresh._sorted_tokens = sorted(fresh._tokens)
+        with self._lock:
+            self._docs, self._tokens, self._trigrams = fresh._docs, fresh._tokens, fresh._trigrams
+            self._sorted_tokens = fresh._sorted_tokens
+            self._results.clear()
+            self.version = version
+            self.ready = True
+
+    def add(self, doc_id, title, content, url):
+        with self._lock:
+            self._remove(doc_id)
+            self._add(doc_id, title, content, url, keep_sorted=True)
+            self._results.clear()
+
+    update = add
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._remove(doc_id)
+            self._results.clear()
+
+    def _add(self, doc_id, title, content, url, keep_sorted=False):
+        doc = {"title": (title or "").lower(), "content": (content or "").lower(), "url": (url or "").lower()}
+        self._docs[doc_id] = doc
+        for field in FIELDS:
+            text = doc[field]
+            for token in set(tokenize(text)):
+                if keep_sorted and token not in self._tokens:
+                    bisect.insort(self._sorted_tokens, token)
+                postings = self._tokens[token]
+                postings[doc_id] = postings.get(doc_id, 0.0) + FIELD_WEIGHTS[field]
+            for gram in trigrams(text):
+                self._trigrams[gram].add(doc_id)
+
+    def _remove(self, doc_id):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for field in FIELDS:
+            text = doc[field]
+            for token in set(tokenize(text)):
+                postings = self._tokens.get(token)
+                if postings is not None:
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        del self._tokens[token]
+                        position = bisect.bisect_left(self._sorted_tokens, token)
+                        if position < len(self._sorted_tokens) and self._sorted_tokens[position] == token:
+                            del self._sorted_tokens[position]
+            for gram in trigrams(text):
+                postings = self._trigrams.get(gram)
+                if postings is not None:
+                    postings.discard(doc_id)
+                    if not postings:
+                        del self._trigrams[gram]
+
+    def _candidates(self, query):
+        if len(query) < SHORT_QUERY_LENGTH:
+            return self._docs.keys()
+        postings = []
+        for gram in trigrams(query):
+            ids = self._trigrams.get(gram)
+            if not ids:
+                return ()
+            postings.append(ids)
+        postings.sort(key=len)
+        return set.intersection(*postings) if len(postings) > 1 else postings[0]
+
+    def search(self, query):
+        """Return matching ids ordered by relevance (best first, ties by id)."""
+        return [doc_id for _, doc_id in self.search_keys(query)]
+
+    def search_keys(self, query):
+        """Return sorted (-score, id) sort keys; usable as keyset cursors.
+
+        The returned list is shared with the result memo and must not be modified.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+        with self._lock:
+            results = self._results.get(query)
+            if results is not None:
+                self._results.move_to_end(query)
+                return results
+            if len(query) < SHORT_QUERY_LENGTH and TOKEN_RE.fullmatch(query):
+                results = self._prefix_keys(query)
+            else:
+                results = self._substring_keys(query)
+            self._results[query] = results
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+            return results
+
+    def _prefix_keys(self, prefix):
+        # Score is the best posting weight among the document's words starting with prefix, plus the exact word's weight
+        start = bisect.bisect_left(self._sorted_tokens, prefix)
+        end = start
+        while end < len(self._sorted_tokens) and self._sorted_tokens[end].startswith(prefix):
+            end += 1
+        matched = sorted((self._tokens[token] for token in self._sorted_tokens[start:end]), key=len, reverse=True)
+        if not matched:
+            return []
+        # Copying the largest postings dict runs in C; only the smaller ones are merged in Python
+        scores = dict(matched[0])
+        for postings in matched[1:]:
+            for doc_id, weight in postings.items():
+                if weight > scores.get(doc_id, 0.0):
+                    scores[doc_id] = weight
+        for doc_id, weight in self._tokens.get(prefix, {}).items():
+            scores[doc_id] += weight
+        return rank(scores)
+
+    def _substring_keys(self, query):
+        query_postings = [self._tokens[token] for token in set(tokenize(query)) if token in self._tokens]
+        scores = {}
+        for doc_id in self._candidates(query):
+            doc = self._docs[doc_id]
+            score = 0.0
+            for field in FIELDS:
+                if query in doc[field]:
+                    score += FIELD_WEIGHTS[field]
+            if not score:
+                continue
+            for postings in query_postings:
+                score += postings.get(doc_id, 0.0)
+            title = doc["title"]
+            if title == query:
+                score += 10.0
+            elif title.startswith(query):
+                score += 5.0
+            scores[doc_id] = score
+        return rank(scores)
+
+
+class PrefixIndex:
+    """Sorted arrays of title and category keys answering prefix lookups with bisect.
+
+    Titles are indexed by their full text and by every later word start, so
+    "lin" finds "Linux Mint" as well as "Kali Linux". Full-title matches are
+    returned before word matches; each lookup is O(log n + limit).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._full = []
+        self._words = []
+        self._titles = {}
+        self._categories = []
+
+    def __len__(self):
+        return len(self._titles)
+
+    @staticmethod
+    def _keys(title):
+        lowered = title.lower()
+        full = lowered.strip()
+        words = {lowered[m.start():] for m in TOKEN_RE.finditer(lowered) if m.start() > 0}
+        return full, words
+
+    def build(self, titles, categories=()):
+        # Built off-lock and swapped in, so suggestions keep working during a rebuild
+        by_id = {}
+        full, words = [], []
+        for doc_id, title in titles:
+            if not title:
+                continue
+            by_id[doc_id] = title
+            full_key, word_keys = self._keys(title)
+            full.append((full_key, doc_id, title))
+            words.extend((key, doc_id, title) for key in word_keys)
+        full.sort()
+        words.sort()
+        with self._lock:
+            self._titles, self._full, self._words = by_id, full, words
+            self.set_categories(categories)
+
+    def set_categories(self, categories):
+        with self._lock:
+            self._categories = sorted((name.lower(), name, count) for name, count in categories if name)
+
+    def add(self, doc_id, title):
+        with self._lock:
+            self._remove(doc_id)
+            if not title:
+                return
+            self._titles[doc_id] = title
+            full_key, word_keys = self._keys(title)
+            bisect.insort(self._full, (full_key, doc_id, title))
+            for key in word_keys:
+                bisect.insort(self._words, (key, doc_id, title))
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        title = self._titles.pop(doc_id, None)
+        if title is None:
+            return
+        full_key, word_keys = self._keys(title)
+        for entries, key in [(self._full, full_key)] + [(self._words, key) for key in word_keys]:
+            position = bisect.bisect_left(entries, (key, doc_id))
+            if position < len(entries) and entries[position][:2] == (key, doc_id):
+                del entries[position]
+
+    @staticmethod
+    def _scan(entries, prefix):
+        position = bisect.bisect_left(entries, (prefix,))
+        while position < len(entries) and entries[position][0].startswith(prefix):
+            yield entries[position]
+            position += 1
+
+    def suggest(self, prefix, limit=8):
+        prefix = ' '.join(prefix.lower().split())
+        if not prefix or limit <= 0:
+            return []
+        suggestions = []
+        seen = set()
+        with self._lock:
+            for key, name, count in self._scan(self._categories, prefix):
+                if len(suggestions) >= limit:
+                    return suggestions
+                suggestions.append({"text": name, "type": "category", "count": count})
+            for entries in (self._full, self._words):
+                for key, doc_id, title in self._scan(entries, prefix):
+                    if len(suggestions) >= limit:
+                        return suggestions
+                    if title not in seen:
+                        seen.add(title)
+                        suggestions.append({"text": title, "type": "title", "id": doc_id})
+        return suggestions
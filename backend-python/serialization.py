@@ -0,0 +1,26 @@
+import datetime
+import json
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib encoder is used when orjson is not installed
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj):
+    """Encode obj as compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_default).encode('utf-8')
+
+
+def rows_to_dicts(result):
+    """Turn a column-select result into plain dicts keyed by column label."""
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result]
@@ -0,0 +1,63 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from collections import namedtuple
+
+Asset = namedtuple('Asset', ['body', 'gzip_body', 'mimetype', 'etag', 'immutable'])
+
+COMPRESSIBLE_TYPES = (
+    'text/', 'application/javascript', 'application/json', 'application/xml',
+    'image/svg+xml', 'application/manifest+json', 'application/wasm', 'application/x-ndjson'
+)
+# Create React App fingerprints everything under build/static, e.g. main.3f2a9c1b.js
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{8,}\.')
+MIN_COMPRESS_SIZE = 512
+
+
+def is_compressible(mimetype):
+    return mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def gzip_bytes(body, level=9):
+    # mtime=0 keeps the output (and so its ETag) identical across workers and restarts
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class StaticAssetCache:
+    """The React build directory held in memory, with gzip variants computed once at startup.
+
+    Requests are answered from this index alone, so serving an asset costs no
+    filesystem calls. The build only changes on deploy, which restarts the workers.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.assets = {}
+
+    def load(self):
+        assets = {}
+        if os.path.isdir(self.root):
+            for directory, _, files in os.walk(self.root):
+                for name in files:
+                    full_path = os.path.join(directory, name)
+                    relative = os.path.relpath(full_path, self.root).replace(os.sep, '/')
+                    with open(full_path, 'rb') as f:
+                        body = f.read()
+                    assets[relative] = self._make_asset(relative, body)
+        self.assets = assets
+        return len(assets)
+
+    def _make_asset(self, relative, body):
+        mimetype = mimetypes.guess_type(relative)[0] or 'application/octet-stream'
+        gzip_body = None
+        if len(body) >= MIN_COMPRESS_SIZE and is_compressible(mimetype):
+            compressed = gzip_bytes(body)
+            if len(compressed) < len(body):
+                gzip_body = compressed
+        immutable = relative.startswith('static/') and bool(HASHED_NAME_RE.search(relative))
+        return Asset(body, gzip_body, mimetype, hashlib.sha1(body).hexdigest(), immutable)
+
+    def get(self, path):
+        return self.assets.get(path)
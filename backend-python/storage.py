@@ -0,0 +1,107 @@
+import functools
+import os
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within the process
+    fcntl = None
+
+
+def is_sqlite_file(uri):
+    url = make_url(uri)
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def absolute_sqlite_uri(uri, basedir):
+    """Anchor a relative SQLite file path at basedir.
+
+    Flask-SQLAlchemy would otherwise resolve it against the app's instance folder,
+    which differs between `flask --app app.py` and gunicorn's `backend-python.app`.
+    """
+    if not is_sqlite_file(uri):
+        return uri
+    url = make_url(uri)
+    if url.database.startswith('file:') or os.path.isabs(url.database):
+        return uri
+    return url.set(database=os.path.join(basedir, url.database)).render_as_string(hide_password=False)
+
+
+def sqlite_engine_options(config):
+    """Engine options for a file-backed SQLite database shared by several gunicorn workers."""
+    return {
+        # Each worker keeps a few connections open; the gunicorn master disposes its pool before forking
+        "pool_size": config['SQLITE_POOL_SIZE'],
+        "max_overflow": config['SQLITE_POOL_SIZE'],
+        "pool_timeout": 30,
+        "connect_args": {
+            "timeout": config['SQLITE_BUSY_TIMEOUT_MS'] / 1000,
+            "check_same_thread": False
+        }
+    }
+
+
+def apply_sqlite_pragmas(engine, config):
+    """Switch the database to WAL and tune every new connection."""
+    pragmas = {
+        "journal_mode": "WAL",
+        # With WAL, NORMAL only fsyncs at checkpoints and stays corruption-safe
+        "synchronous": "NORMAL",
+        "busy_timeout": config['SQLITE_BUSY_TIMEOUT_MS'],
+        "mmap_size": config['SQLITE_MMAP_SIZE'],
+        # Negative values are KiB rather than pages
+        "cache_size": -config['SQLITE_CACHE_SIZE_KB'],
+        "temp_store": "MEMORY"
+    }
+
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+class WriteSerializer:
+    """Single-writer queue for SQLite.
+
+    Writers from every thread and every worker process wait on an exclusive
+    lock file in turn instead of racing for SQLite's write lock and spinning
+    on "database is locked". Readers never take it, and under WAL they keep
+    reading the last committed snapshot while a write is in progress.
+    """
+
+    def __init__(self, lock_path=None):
+        self.lock_path = lock_path
+        self._thread_lock = threading.Lock()
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        self._file = None
+        if self.lock_path and fcntl is not None:
+            try:
+                self._file = open(self.lock_path, 'a')
+                fcntl.flock(self._file, fcntl.LOCK_EX)
+            except OSError:
+                self._close()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self._close()
+        self._thread_lock.release()
+        return False
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()  # closing the descriptor releases the flock
+            self._file = None
+
+    def __call__(self, view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            with self:
+                return view(*args, **kwargs)
+        return wrapper
@@ -0,0 +1,107 @@
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkcheck import LinkChecker
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = {}
+    hits_lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _count(self):
+        with self.hits_lock:
+            self.hits[self.command, self.path] = self.hits.get((self.command, self.path), 0) + 1
+            return self.hits[self.command, self.path]
+
+    def _reply(self, status, headers=(), body=b''):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        attempt = self._count()
+        if self.path == '/ok':
+            self._reply(200)
+        elif self.path == '/redirect':
+            self._reply(301, [('Location', '/ok')])
+        elif self.path == '/no-head':
+            self._reply(405)
+        elif self.path == '/flaky':
+            self._reply(503 if attempt == 1 else 200)
+        else:
+            self._reply(404)
+
+    def do_GET(self):
+        self._count()
+        if self.path == '/no-head':
+            self._reply(200, body=b'downloadable')
+        else:
+            self._reply(404)
+
+
+class LinkCheckerStubServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.hits.clear()
+        self.checker = LinkChecker(max_workers=4, per_host=2, timeout=5, retries=2, backoff=0, allow_private=True)
+
+    def test_redirect_records_final_url(self):
+        result = self.checker.check(self.base + '/redirect')
+        self.assertTrue(result.ok)
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.final_url, self.base + '/ok')
+
+    def test_head_rejected_falls_back_to_get(self):
+        result = self.checker.check(self.base + '/no-head')
+        self.assertTrue(result.ok)
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(StubHandler.hits[('GET', '/no-head')], 1)
+
+    def test_not_found_is_broken(self):
+        result = self.checker.check(self.base + '/missing')
+        self.assertFalse(result.ok)
+        self.assertEqual(result.status_code, 404)
+        self.assertIsNone(result.error)
+
+    def test_server_error_is_retried(self):
+        result = self.checker.check(self.base + '/flaky')
+        self.assertTrue(result.ok)
+        self.assertEqual(StubHandler.hits[('HEAD', '/flaky')], 2)
+
+    def test_check_all_returns_every_key(self):
+        items = [(1, self.base + '/ok'), (2, self.base + '/missing'), (3, self.base + '/redirect')]
+        results = dict(self.checker.check_all(items))
+        self.assertEqual({key: result.ok for key, result in results.items()}, {1: True, 2: False, 3: True})
+
+    def test_private_addresses_blocked_by_default(self):
+        result = LinkChecker(retries=0).check(self.base + '/ok')
+        self.assertFalse(result.ok)
+        self.assertIn('BlockedAddressError', result.error)
+        self.assertNotIn(('HEAD', '/ok'), StubHandler.hits)
+
+
+if __name__ == '__main__':
+    unittest.main()